@@ -5,18 +5,46 @@ Fetch USC Women's Basketball game data from ESPN API and generate static HTML.
 Usage:
     python fetch_games.py          # Only update if game is live or starting within 60 min
     python fetch_games.py --force  # Always update (used hourly and for manual triggers)
+    python fetch_games.py --only NU  # Only regenerate one team's pages (plus b1g.html)
+    python fetch_games.py --rebuild  # Rewrite final game pages even if their game key is unchanged
+
+Only the standard library is required. If orjson is installed it is used to
+parse and write JSON (ESPN responses and the on-disk caches), which is faster
+for the large game summaries; otherwise the stdlib json module is used.
+
+Performance notes:
+    The work here is string formatting, dict walking and datetime parsing with
+    no numeric inner loops, so Numba/Cython are not a fit (strings and dicts
+    fall back to object mode and end up slower). Look instead at CPython-level
+    changes (precomputed %-templates, hoisted constants), single-pass loops and
+    caching, concurrent HTTP/page generation, and JSON parsing via orjson.
 """
 
+import argparse
+import hashlib
+import http.client
 import json
 import os
 import re
 import subprocess
 import sys
-import urllib.request
+import textwrap
+import threading
+import urllib.error
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from itertools import cycle
+from operator import add, itemgetter
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used when unavailable
+    orjson = None
+
 # Pacific Time zone
 PT = ZoneInfo("America/Los_Angeles")
 
@@ -32,31 +60,161 @@ BASE_API = f"https://site.api.espn.com/apis/site/v2/sports/{SPORT}/{LEAGUE}"
 # How many minutes before game start to begin frequent updates
 PREGAME_WINDOW_MINUTES = 60
 
-# Version string based on last commit
-try:
-    _commit_hash = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
-    _commit_date = subprocess.check_output(["git", "log", "-1", "--format=%ai"], stderr=subprocess.DEVNULL).decode().strip()
-    _commit_dt = datetime.fromisoformat(_commit_date).astimezone(ZoneInfo("America/Los_Angeles"))
-    VERSION = _commit_dt.strftime("v%Y.%m.%d-%H:%M") + "." + _commit_hash
-except Exception:
-    VERSION = "v0.0.0"
+# Max concurrent HTTP requests when fanning out per-game/per-athlete fetches
+FETCH_WORKERS = 8
+
+# Version string based on last commit (set SKIP_VERSION=1 to skip calling git)
+VERSION = "v0.0.0"
+if not os.environ.get("SKIP_VERSION"):
+    try:
+        _commit_info = subprocess.check_output(["git", "log", "-1", "--format=%h %ai"], stderr=subprocess.DEVNULL).decode().strip()
+        _commit_hash, _commit_date = _commit_info.split(" ", 1)
+        _commit_dt = datetime.fromisoformat(_commit_date).astimezone(ZoneInfo("America/Los_Angeles"))
+        VERSION = _commit_dt.strftime("v%Y.%m.%d-%H:%M") + "." + _commit_hash
+    except Exception:
+        pass
+
+
+def json_loads(data: bytes):
+    """Parse JSON from raw bytes (orjson if installed, else stdlib json)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent=True) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson if installed, else stdlib json)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def write_bytes_atomic(path: Path, data: bytes):
+    """Write data to path via a temp file and rename, so readers never see a partial file."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+HTTP_CACHE_DIR = Path(__file__).parent.parent / "data" / "http_cache"
+
+# Idle keep-alive connections by (scheme, host), shared across threads
+_http_pool = {}
+_http_pool_lock = threading.Lock()
+
 
+def http_get(url: str, headers: dict, redirects: int = 5) -> tuple[int, http.client.HTTPMessage, bytes]:
+    """GET a URL over a pooled keep-alive connection.
 
-def fetch_json(url: str) -> dict:
-    """Fetch JSON from URL."""
-    req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return json.loads(resp.read().decode())
+    Returns (status, headers, body). Connections are returned to the pool
+    after each response so repeated calls to the same host skip the TCP/TLS
+    handshake. Redirects are followed; other statuses are returned as-is.
+    """
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    with _http_pool_lock:
+        idle = _http_pool.get(key)
+        conn = idle.pop() if idle else None
+    reused = conn is not None
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        conn = conn_class(parts.netloc, timeout=30)
+
+    try:
+        conn.request("GET", path, headers=headers)
+        resp = conn.getresponse()
+        body = resp.read()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        conn.close()
+        if reused:
+            # Server dropped an idle connection; retry once on a fresh one
+            return http_get(url, headers, redirects)
+        raise
+    except Exception:
+        conn.close()
+        raise
+
+    if resp.will_close:
+        conn.close()
+    else:
+        with _http_pool_lock:
+            _http_pool.setdefault(key, []).append(conn)
+
+    location = resp.headers.get("Location")
+    if resp.status in (301, 302, 303, 307, 308) and location and redirects > 0:
+        return http_get(urllib.parse.urljoin(url, location), headers, redirects - 1)
+    return resp.status, resp.headers, body
+
+
+def fetch_json(url: str, conditional: bool = False) -> dict:
+    """Fetch JSON from URL.
+
+    Not memoized, since most URLs (game summaries, athletes) are requested
+    once; see fetch_json_shared for the few that several passes read.
+
+    With conditional=True, the response body is stored on disk along with its
+    ETag/Last-Modified validators, and later requests send If-None-Match /
+    If-Modified-Since so an unchanged resource (304) is served from disk.
+    """
+    headers = {"User-Agent": "Mozilla/5.0"}
+    cached = None
+    if conditional:
+        cache_path = HTTP_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+        if cache_path.exists():
+            try:
+                cached = json_loads(cache_path.read_bytes())
+            except (json.JSONDecodeError, OSError):
+                pass
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+    status, resp_headers, body = http_get(url, headers)
+    if status == 304 and cached:
+        return cached["body"]
+    if not 200 <= status < 300:
+        raise urllib.error.HTTPError(url, status, http.client.responses.get(status, ""), resp_headers, None)
+    data = json_loads(body)
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+
+    if conditional and (etag or last_modified):
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        entry = {"url": url, "etag": etag, "last_modified": last_modified, "body": data}
+        write_bytes_atomic(cache_path, json_dumps(entry, indent=False))
+    return data
+
+
+@lru_cache(maxsize=16)
+def fetch_json_shared(url: str, conditional: bool = False) -> dict:
+    """fetch_json, memoized for the rest of the run.
+
+    For the few URLs several passes request (team schedules, the odds feed),
+    so they are only fetched and parsed once. The returned object is shared
+    between callers.
+    """
+    return fetch_json(url, conditional)
 
 
 ODDS_CACHE_PATH = Path(__file__).parent.parent / "data" / "odds_cache.json"
 
 
+@lru_cache(maxsize=1)
 def load_odds_cache() -> dict:
-    """Load cached odds data from disk."""
+    """Load cached odds data from disk.
+
+    The parsed cache is read once per run; callers share and update the same
+    dict, and save_odds_cache writes it back.
+    """
     if ODDS_CACHE_PATH.exists():
         try:
-            return json.loads(ODDS_CACHE_PATH.read_text())
+            return json_loads(ODDS_CACHE_PATH.read_bytes())
         except (json.JSONDecodeError, OSError):
             pass
     return {}
@@ -65,7 +223,7 @@ def load_odds_cache() -> dict:
 def save_odds_cache(cache: dict):
     """Save odds cache to disk."""
     ODDS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    ODDS_CACHE_PATH.write_text(json.dumps(cache, indent=2))
+    write_bytes_atomic(ODDS_CACHE_PATH, json_dumps(cache))
 
 
 def fetch_game_odds(event_id: str, home_display_name: str, away_display_name: str) -> dict | None:
@@ -88,7 +246,7 @@ def fetch_game_odds(event_id: str, home_display_name: str, away_display_name: st
     )
 
     try:
-        data = fetch_json(url)
+        data = fetch_json_shared(url)
     except Exception as e:
         print(f"  Odds API error: {e}")
         return None
@@ -108,26 +266,30 @@ def fetch_game_odds(event_id: str, home_display_name: str, away_display_name: st
     book = matched["bookmakers"][0]
     markets = {m["key"]: m for m in book.get("markets", [])}
 
+    def outcomes_by_name(market_key):
+        # First outcome per name, so lookups match a linear scan
+        by_name = {}
+        for outcome in markets.get(market_key, {}).get("outcomes", []):
+            by_name.setdefault(outcome.get("name"), outcome)
+        return by_name
+
     odds_data = {}
 
-    # Spread
-    spreads = markets.get("spreads", {}).get("outcomes", [])
-    if spreads:
-        # Find the home team spread
-        for outcome in spreads:
-            if outcome.get("name") == home_display_name:
-                odds_data["spread"] = {
-                    "team": home_display_name,
-                    "line": str(outcome.get("point", "")),
-                    "price": str(outcome.get("price", "")),
-                }
-                break
+    # Spread (home team's line)
+    spreads = outcomes_by_name("spreads")
+    home_spread = spreads.get(home_display_name)
+    if home_spread is not None:
+        odds_data["spread"] = {
+            "team": home_display_name,
+            "line": str(home_spread.get("point", "")),
+            "price": str(home_spread.get("price", "")),
+        }
 
     # Total
-    totals = markets.get("totals", {}).get("outcomes", [])
+    totals = outcomes_by_name("totals")
     if totals:
-        over = next((o for o in totals if o.get("name") == "Over"), {})
-        under = next((o for o in totals if o.get("name") == "Under"), {})
+        over = totals.get("Over", {})
+        under = totals.get("Under", {})
         odds_data["total"] = {
             "line": str(over.get("point", "")),
             "over_price": str(over.get("price", "")),
@@ -135,10 +297,10 @@ def fetch_game_odds(event_id: str, home_display_name: str, away_display_name: st
         }
 
     # Moneyline (h2h)
-    h2h = markets.get("h2h", {}).get("outcomes", [])
+    h2h = outcomes_by_name("h2h")
     if h2h:
-        home_ml = next((o for o in h2h if o.get("name") == home_display_name), {})
-        away_ml = next((o for o in h2h if o.get("name") == away_display_name), {})
+        home_ml = h2h.get(home_display_name, {})
+        away_ml = h2h.get(away_display_name, {})
         odds_data["moneyline"] = {
             "home": str(home_ml.get("price", "")),
             "away": str(away_ml.get("price", "")),
@@ -155,9 +317,18 @@ def fetch_game_odds(event_id: str, home_display_name: str, away_display_name: st
     return None
 
 
-def calculate_plus_minus(plays, boxscore, home_team_id):
-    """Calculate plus/minus for each player by tracking who's on court during scoring."""
+def calculate_plus_minus(plays, boxscore, home_team_id, periods=None):
+    """Calculate plus/minus for each player by tracking who's on court during scoring.
+
+    Keeps a running home-minus-away margin and credits each stint on court
+    with the margin change between entering and leaving, so scoring plays
+    don't have to touch every player on the floor. With periods, only scoring
+    plays in those periods move the margin (for the period views); substitutions
+    are always tracked so the lineups stay accurate.
+    """
+    period_set = set(periods) if periods is not None else None
     plus_minus = {}
+    # Per team: athlete_id -> margin when the current stint began
     on_court = {}
 
     players_data = boxscore.get("players", [])
@@ -166,48 +337,62 @@ def calculate_plus_minus(plays, boxscore, home_team_id):
         statistics = team_data.get("statistics", [])
         if statistics:
             athletes = statistics[0].get("athletes", [])
-            starters = [a.get("athlete", {}).get("id") for a in athletes if a.get("starter")]
-            on_court[team_id] = set(starters)
+            starters = {}
             for a in athletes:
                 athlete_id = a.get("athlete", {}).get("id")
                 if athlete_id:
                     plus_minus[athlete_id] = 0
+                    if a.get("starter"):
+                        starters[athlete_id] = 0
+            on_court[team_id] = starters
+
+    def close_stint(team_id, athlete_id, start):
+        gained = margin - start
+        plus_minus[athlete_id] += gained if team_id == home_team_id else -gained
 
     prev_home_score = 0
     prev_away_score = 0
+    margin = 0
 
     for play in plays:
-        play_type = play.get("type", {}).get("text", "").lower()
-        play_text = play.get("text", "").lower()
-        home_score = play.get("homeScore", prev_home_score)
-        away_score = play.get("awayScore", prev_away_score)
+        play_get = play.get
 
-        if "substitution" in play_type:
-            participants = play.get("participants", [])
-            team_id = play.get("team", {}).get("id", "")
+        # Exact type match (as in calculate_possessions); only subs need their text lowercased
+        if play_get("type", {}).get("text") == "Substitution":
+            participants = play_get("participants", [])
+            team_id = play_get("team", {}).get("id", "")
             if participants and team_id in on_court:
                 athlete_id = participants[0].get("athlete", {}).get("id")
-                if athlete_id:
+                # Only track known athletes so every stint has a plus_minus entry
+                if athlete_id in plus_minus:
+                    players_on = on_court[team_id]
+                    play_text = play_get("text", "").lower()
                     if "subbing out" in play_text or "exits" in play_text:
-                        on_court[team_id].discard(athlete_id)
+                        start = players_on.pop(athlete_id, None)
+                        if start is not None:
+                            close_stint(team_id, athlete_id, start)
                     elif "subbing in" in play_text or "enters" in play_text:
-                        on_court[team_id].add(athlete_id)
+                        players_on.setdefault(athlete_id, margin)
 
-        home_diff = home_score - prev_home_score
-        away_diff = away_score - prev_away_score
+        # Scores only move on scoring plays. Deltas are taken against the last
+        # scoring play, so points are never dropped if a play lacks the scores.
+        if not play_get("scoringPlay"):
+            continue
+        home_score = play_get("homeScore", prev_home_score)
+        away_score = play_get("awayScore", prev_away_score)
 
-        if home_diff != 0 or away_diff != 0:
-            for team_id, players_on in on_court.items():
-                for athlete_id in players_on:
-                    if athlete_id in plus_minus:
-                        if team_id == home_team_id:
-                            plus_minus[athlete_id] += home_diff - away_diff
-                        else:
-                            plus_minus[athlete_id] += away_diff - home_diff
+        # Net change from the home team's perspective; away players get the negation
+        if period_set is None or play_get("period", {}).get("number", 0) in period_set:
+            margin += (home_score - prev_home_score) - (away_score - prev_away_score)
 
         prev_home_score = home_score
         prev_away_score = away_score
 
+    # Credit everyone still on court at the final play
+    for team_id, players_on in on_court.items():
+        for athlete_id, start in players_on.items():
+            close_stint(team_id, athlete_id, start)
+
     return plus_minus
 
 
@@ -350,67 +535,6 @@ def compute_period_stats(plays, periods):
     return stats
 
 
-def compute_period_plus_minus(plays, boxscore, home_team_id, periods):
-    """Calculate plus/minus for each player filtered to specific periods."""
-    period_set = set(periods)
-    plus_minus = {}
-    on_court = {}
-
-    players_data = boxscore.get("players", [])
-    for team_data in players_data:
-        team_id = team_data.get("team", {}).get("id", "")
-        statistics = team_data.get("statistics", [])
-        if statistics:
-            athletes = statistics[0].get("athletes", [])
-            starters = [a.get("athlete", {}).get("id") for a in athletes if a.get("starter")]
-            on_court[team_id] = set(starters)
-            for a in athletes:
-                athlete_id = a.get("athlete", {}).get("id")
-                if athlete_id:
-                    plus_minus[athlete_id] = 0
-
-    prev_home_score = 0
-    prev_away_score = 0
-
-    for play in plays:
-        play_type = play.get("type", {}).get("text", "").lower()
-        play_text = play.get("text", "").lower()
-        home_score = play.get("homeScore", prev_home_score)
-        away_score = play.get("awayScore", prev_away_score)
-        period_num = play.get("period", {}).get("number", 0)
-
-        # Always track substitutions regardless of period (to keep on_court accurate)
-        if "substitution" in play_type:
-            participants = play.get("participants", [])
-            team_id = play.get("team", {}).get("id", "")
-            if participants and team_id in on_court:
-                athlete_id = participants[0].get("athlete", {}).get("id")
-                if athlete_id:
-                    if "subbing out" in play_text or "exits" in play_text:
-                        on_court[team_id].discard(athlete_id)
-                    elif "subbing in" in play_text or "enters" in play_text:
-                        on_court[team_id].add(athlete_id)
-
-        # Only count score changes in the requested periods
-        if period_num in period_set:
-            home_diff = home_score - prev_home_score
-            away_diff = away_score - prev_away_score
-
-            if home_diff != 0 or away_diff != 0:
-                for team_id, players_on in on_court.items():
-                    for athlete_id in players_on:
-                        if athlete_id in plus_minus:
-                            if team_id == home_team_id:
-                                plus_minus[athlete_id] += home_diff - away_diff
-                            else:
-                                plus_minus[athlete_id] += away_diff - home_diff
-
-        prev_home_score = home_score
-        prev_away_score = away_score
-
-    return plus_minus
-
-
 ROSTER_CACHE_DIR = Path(__file__).parent.parent / "data"
 
 
@@ -424,161 +548,162 @@ def get_roster_with_stats_cached(team_id=USC_TEAM_ID, season=None) -> list:
         cache_path = ROSTER_CACHE_DIR / f"roster_cache_{team_id}_{season}.json"
         if cache_path.exists():
             try:
-                return json.loads(cache_path.read_text())
+                return json_loads(cache_path.read_bytes())
             except (json.JSONDecodeError, OSError):
                 pass
         # Fetch and cache
         roster = get_roster_with_stats(team_id=team_id, season=season)
         ROSTER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        cache_path.write_text(json.dumps(roster, indent=2))
+        write_bytes_atomic(cache_path, json_dumps(roster))
         return roster
     return get_roster_with_stats(team_id=team_id, season=season)
 
 
-def get_roster_with_stats(team_id=USC_TEAM_ID, season=None) -> list:
-    """Get team roster with season stats aggregated from game box scores."""
-    # Get schedule to find completed games
-    schedule_url = f"{BASE_API}/teams/{team_id}/schedule"
-    if season is not None:
-        schedule_url += f"?season={season}"
-    schedule_data = fetch_json(schedule_url)
+@lru_cache(maxsize=1024)
+def parse_shooting(stat) -> tuple:
+    """Parse a made-attempted shooting stat ("5-10" or "5/10") into ints.
 
-    events = schedule_data.get("events", [])
-    completed = [e for e in events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") == "post"]
+    The strings repeat heavily across players and games, so results are cached.
+    """
+    if not stat or stat == '--':
+        return (0, 0)
+    parts = stat.replace("/", "-").split("-")
+    if len(parts) == 2:
+        try:
+            return (int(parts[0]), int(parts[1]))
+        except ValueError:
+            pass
+    return (0, 0)
 
-    # Aggregate stats from each game
-    # ESPN indices: 0=MIN, 1=PTS, 2=FG, 3=3PT, 4=FT, 5=REB, 6=AST, 7=TO, 8=STL, 9=BLK, 10=OREB, 11=DREB, 12=PF
-    player_totals = {}
 
-    def parse_shooting(stat):
-        if not stat or stat == '--':
-            return (0, 0)
-        parts = stat.replace("/", "-").split("-")
-        if len(parts) == 2:
-            try:
-                return (int(parts[0]), int(parts[1]))
-            except ValueError:
-                pass
-        return (0, 0)
+def parse_count(stat) -> int:
+    """Parse a counting stat ("12") into an int, with "" or "--" (DNP) as 0."""
+    return int(stat) if stat and stat != '--' else 0
 
-    for event in completed:
-        event_id = event.get("id")
-        if not event_id:
-            continue
 
-        try:
-            summary_url = f"{BASE_API}/summary?event={event_id}"
-            game_data = fetch_json(summary_url)
-
-            boxscore = game_data.get("boxscore", {})
-            players = boxscore.get("players", [])
-
-            # Calculate plus/minus and possessions for this game
-            game_pm = {}
-            game_poss = {}
-            plays = game_data.get("plays", [])
-            if plays:
-                header = game_data.get("header", {})
-                header_comps = header.get("competitions", [{}])[0]
-                header_competitors = header_comps.get("competitors", [])
-                home_comp = next((c for c in header_competitors if c.get("homeAway") == "home"), {})
-                home_id = home_comp.get("team", {}).get("id", "")
-                game_pm = calculate_plus_minus(plays, boxscore, home_id)
-                game_poss = calculate_possessions(plays, boxscore, team_id)
-
-            for team in players:
-                if team.get("team", {}).get("id") != team_id:
-                    continue
+# ESPN box score columns for MIN, PTS, AST, TO, STL, BLK, OREB, DREB, PF
+ROSTER_COUNT_COLUMNS = itemgetter(0, 1, 6, 7, 8, 9, 10, 11, 12)
 
-                statistics = team.get("statistics", [])
-                if not statistics:
-                    continue
+# Counting stats summed per athlete across games, in the order they're accumulated
+ROSTER_STAT_KEYS = ("min", "pts", "ast", "stl", "blk", "to", "orb", "drb", "fls",
+                    "fg_made", "fg_att", "three_made", "three_att", "ft_made", "ft_att",
+                    "pm", "poss", "gp")
 
-                athletes = statistics[0].get("athletes", [])
-                for a in athletes:
-                    athlete = a.get("athlete", {})
-                    athlete_id = athlete.get("id")
-                    if not athlete_id:
-                        continue
 
-                    stats = a.get("stats", [])
-                    if len(stats) < 13:
-                        continue
+def aggregate_game(game_data: dict, team_id=USC_TEAM_ID) -> list:
+    """Per-player stat lines for one team from a game summary.
 
-                    # Parse stats (handle DNP)
-                    try:
-                        mins = int(stats[0]) if stats[0] and stats[0] != '--' else 0
-                        pts = int(stats[1]) if stats[1] and stats[1] != '--' else 0
-                        ast = int(stats[6]) if stats[6] and stats[6] != '--' else 0
-                        stl = int(stats[8]) if stats[8] and stats[8] != '--' else 0
-                        blk = int(stats[9]) if stats[9] and stats[9] != '--' else 0
-                        to = int(stats[7]) if stats[7] and stats[7] != '--' else 0
-                        orb = int(stats[10]) if stats[10] and stats[10] != '--' else 0
-                        drb = int(stats[11]) if stats[11] and stats[11] != '--' else 0
-                        fls = int(stats[12]) if stats[12] and stats[12] != '--' else 0
-                    except (ValueError, IndexError):
-                        continue
+    Returns [(athlete, values)] for each player who logged minutes, where
+    values are in ROSTER_STAT_KEYS order with games played counted as 1.
+    """
+    # ESPN indices: 0=MIN, 1=PTS, 2=FG, 3=3PT, 4=FT, 5=REB, 6=AST, 7=TO, 8=STL, 9=BLK, 10=OREB, 11=DREB, 12=PF
+    lines = []
+    boxscore = game_data.get("boxscore", {})
+    players = boxscore.get("players", [])
+
+    # Only this team's box score is needed; skip games it has none for
+    team = next((t for t in players if t.get("team", {}).get("id") == team_id), None)
+    statistics = team.get("statistics", []) if team else []
+    if not statistics:
+        return lines
+
+    # Calculate plus/minus and possessions for this game
+    game_pm = {}
+    game_poss = {}
+    plays = game_data.get("plays", [])
+    if plays:
+        header = game_data.get("header", {})
+        header_comps = header.get("competitions", [{}])[0]
+        header_competitors = header_comps.get("competitors", [])
+        home_id = split_home_away(header_competitors)[0].get("team", {}).get("id", "")
+        game_pm = calculate_plus_minus(plays, boxscore, home_id)
+        game_poss = calculate_possessions(plays, boxscore, team_id)
+
+    athletes = statistics[0].get("athletes", [])
+    for a in athletes:
+        athlete = a.get("athlete", {})
+        athlete_id = athlete.get("id")
+        if not athlete_id:
+            continue
 
-                    fg_m, fg_a = parse_shooting(stats[2] if stats[2] and stats[2] != '--' else "0-0")
-                    three_m, three_a = parse_shooting(stats[3] if stats[3] and stats[3] != '--' else "0-0")
-                    ft_m, ft_a = parse_shooting(stats[4] if stats[4] and stats[4] != '--' else "0-0")
+        stats = a.get("stats", [])
+        if len(stats) < 13:
+            continue
 
-                    # Only count if player actually played
-                    if mins == 0:
-                        continue
+        # Parse stats (handle DNP)
+        try:
+            mins, pts, ast, to, stl, blk, orb, drb, fls = map(parse_count, ROSTER_COUNT_COLUMNS(stats))
+        except ValueError:
+            continue
+
+        # Only count if player actually played
+        if mins == 0:
+            continue
+
+        fg_m, fg_a = parse_shooting(stats[2])
+        three_m, three_a = parse_shooting(stats[3])
+        ft_m, ft_a = parse_shooting(stats[4])
+
+        lines.append((athlete, (mins, pts, ast, stl, blk, to, orb, drb, fls,
+                                fg_m, fg_a, three_m, three_a, ft_m, ft_a,
+                                game_pm.get(athlete_id, 0), game_poss.get(athlete_id, 0), 1)))
+    return lines
 
-                    if athlete_id not in player_totals:
-                        player_totals[athlete_id] = {
-                            "name": athlete.get("displayName", "Unknown"),
-                            "jersey": athlete.get("jersey", ""),
-                            "min": 0, "pts": 0, "ast": 0, "stl": 0, "blk": 0,
-                            "fg_made": 0, "fg_att": 0, "three_made": 0, "three_att": 0,
-                            "ft_made": 0, "ft_att": 0, "orb": 0, "drb": 0,
-                            "to": 0, "fls": 0, "pm": 0, "gp": 0, "poss": 0
-                        }
-
-                    t = player_totals[athlete_id]
-                    t["min"] += mins
-                    t["pts"] += pts
-                    t["ast"] += ast
-                    t["stl"] += stl
-                    t["blk"] += blk
-                    t["to"] += to
-                    t["orb"] += orb
-                    t["drb"] += drb
-                    t["fls"] += fls
-                    t["fg_made"] += fg_m
-                    t["fg_att"] += fg_a
-                    t["three_made"] += three_m
-                    t["three_att"] += three_a
-                    t["ft_made"] += ft_m
-                    t["ft_att"] += ft_a
-                    t["pm"] += game_pm.get(athlete_id, 0)
-                    t["poss"] += game_poss.get(athlete_id, 0)
-                    t["gp"] += 1
 
+def get_roster_with_stats(team_id=USC_TEAM_ID, season=None, completed=None) -> list:
+    """Get team roster with season stats aggregated from game box scores.
+
+    completed is the season's finished schedule events, if the caller already
+    has them; otherwise the schedule is fetched.
+    """
+    if completed is None:
+        # Get schedule to find completed games
+        schedule_data = get_team_schedule(team_id=team_id, season=season)
+        completed = split_event_states(schedule_data.get("events", []))[0]
+
+    # Column layout: one row of ROSTER_STAT_KEYS counters per athlete, with
+    # names and jerseys in parallel lists
+    athlete_rows = {}
+    names = []
+    jerseys = []
+    totals = []
+
+    def game_lines(event_id):
+        try:
+            return aggregate_game(get_game_summary_cached(event_id), team_id)
         except Exception:
-            continue
+            return []
+
+    # Fetch and tally each game summary concurrently (network-bound), then
+    # merge into the season totals serially, in schedule order
+    event_ids = [e.get("id") for e in completed if e.get("id")]
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        for lines in executor.map(game_lines, event_ids):
+            for athlete, game_values in lines:
+                athlete_id = athlete["id"]
+                row_idx = athlete_rows.get(athlete_id)
+                if row_idx is None:
+                    row_idx = athlete_rows[athlete_id] = len(totals)
+                    names.append(athlete.get("displayName", "Unknown"))
+                    jerseys.append(athlete.get("jersey", ""))
+                    totals.append([0] * len(ROSTER_STAT_KEYS))
+                row = totals[row_idx]
+                row[:] = map(add, row, game_values)
 
     # Return raw totals
     players = []
-    for athlete_id, t in player_totals.items():
-        if t["gp"] > 0:
-            players.append({
-                "name": t["name"],
-                "jersey": t["jersey"],
-                "gp": t["gp"],
-                "min": t["min"],
-                "fg_made": t["fg_made"], "fg_att": t["fg_att"],
-                "three_made": t["three_made"], "three_att": t["three_att"],
-                "ft_made": t["ft_made"], "ft_att": t["ft_att"],
-                "orb": t["orb"], "drb": t["drb"],
-                "ast": t["ast"], "stl": t["stl"], "blk": t["blk"],
-                "to": t["to"], "fls": t["fls"], "pts": t["pts"], "pm": t["pm"], "poss": t["poss"],
-            })
+    for name, jersey, row in zip(names, jerseys, totals):
+        player = {"name": name, "jersey": jersey}
+        player.update(zip(ROSTER_STAT_KEYS, row))
+        if player["gp"] > 0:
+            players.append(player)
 
     # Sort by minutes desc, points desc, last name asc (same as game page)
-    players.sort(key=lambda x: (-x.get("min", 0), -x.get("pts", 0), x.get("name", "").split()[-1] if x.get("name") else "ZZZ"))
+    def roster_sort_key(p):
+        name = p["name"]
+        return (-p["min"], -p["pts"], name.rstrip().rpartition(" ")[2] if name else "ZZZ")
+
+    players.sort(key=roster_sort_key)
     return players
 
 
@@ -586,7 +711,7 @@ def get_rankings() -> dict:
     """Get current AP Top 25 rankings as a lookup dict {team_abbrev: rank}."""
     url = f"{BASE_API}/rankings"
     try:
-        data = fetch_json(url)
+        data = fetch_json(url, conditional=True)
         rankings = {}
         for ranking in data.get("rankings", []):
             if "AP" in ranking.get("name", ""):
@@ -611,19 +736,78 @@ def get_team_schedule(team_id=USC_TEAM_ID, season=None) -> dict:
     url = f"{BASE_API}/teams/{team_id}/schedule"
     if season:
         url += f"?season={season}"
-    return fetch_json(url)
+    schedule = fetch_json_shared(url, conditional=True)
+    # Schedule scores come as {"value", "displayValue"} dicts; store display
+    # strings once so every page can use them directly. The response is
+    # memoized, so later calls see the already-normalized events.
+    for event in schedule.get("events", []):
+        for comp in event.get("competitions", []):
+            for c in comp.get("competitors", []):
+                if isinstance(c.get("score"), dict):
+                    c["score"] = score_text(c["score"])
+    return schedule
 
 
 def get_scoreboard() -> dict:
     """Get today's scoreboard for all games."""
     url = f"{BASE_API}/scoreboard"
-    return fetch_json(url)
+    return fetch_json(url, conditional=True)
+
+
+# Summary sections the pages use; the rest (news, article, pickcenter, ...) is dropped
+SUMMARY_KEYS = ("header", "boxscore", "gameInfo", "plays")
+
+# Summaries of games that aren't final yet, which both the home page and the
+# game page read (final summaries are read back from SUMMARY_CACHE_DIR instead)
+_live_summaries = {}
+
+
+def summary_state(summary: dict) -> str | None:
+    """Get a game summary's status state ("pre", "in", "post"), or None if missing."""
+    competitions = summary.get("header", {}).get("competitions", [{}])
+    comp = competitions[0] if competitions else {}
+    return comp.get("status", {}).get("type", {}).get("state")
 
 
 def get_game_summary(event_id: str) -> dict:
-    """Get detailed game summary including play-by-play."""
-    url = f"{BASE_API}/summary?event={event_id}"
-    return fetch_json(url)
+    """Get detailed game summary including play-by-play.
+
+    The response is trimmed to SUMMARY_KEYS as soon as it is parsed, so the
+    unused sections are never memoized or written to the disk cache. Only
+    summaries of games that aren't final are memoized for the run, so a cold
+    run doesn't hold every final game's payload in memory.
+    """
+    summary = _live_summaries.get(event_id)
+    if summary is None:
+        full = fetch_json(f"{BASE_API}/summary?event={event_id}")
+        summary = {key: full[key] for key in SUMMARY_KEYS if key in full}
+        if summary_state(summary) != "post":
+            _live_summaries[event_id] = summary
+    return summary
+
+
+SUMMARY_CACHE_DIR = Path(__file__).parent.parent / "data" / "summary_cache"
+
+
+def get_game_summary_cached(event_id: str) -> dict:
+    """Get game summary, using disk cache for completed games.
+
+    Only final ("post") summaries are written to the cache since live and
+    upcoming games keep changing; a cached summary is therefore always final.
+    Summaries arrive trimmed to SUMMARY_KEYS (see get_game_summary), which
+    keeps cache files small and fast to parse on later runs.
+    """
+    cache_path = SUMMARY_CACHE_DIR / f"{event_id}.json"
+    if cache_path.exists():
+        try:
+            return json_loads(cache_path.read_bytes())
+        except (json.JSONDecodeError, OSError):
+            pass
+    summary = get_game_summary(event_id)
+    if summary_state(summary) == "post":
+        SUMMARY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_bytes_atomic(cache_path, json_dumps(summary, indent=False))
+    return summary
 
 
 def get_b1g_standings() -> list:
@@ -670,11 +854,11 @@ def get_b1g_leaders(team_id_map: dict) -> dict:
         "stealsPerGame": "STL PER GAME",
         "blocksPerGame": "BLK PER GAME",
     }
-    cat_order = list(target_cats.keys())
 
     # Collect leaders per category and unique athlete refs
     raw = {}  # cat_name -> [(display_value, athlete_ref, team_abbrev), ...]
     athlete_refs = {}  # athlete_ref -> None (to deduplicate)
+    team_id_map_get = team_id_map.get
 
     for cat in data.get("categories", []):
         name = cat.get("name", "")
@@ -686,10 +870,9 @@ def get_b1g_leaders(team_id_map: dict) -> dict:
             athlete_ref = leader.get("athlete", {}).get("$ref", "")
             team_ref = leader.get("team", {}).get("$ref", "")
 
-            # Extract team ID from $ref URL
-            team_match = re.search(r"/teams/(\d+)", team_ref)
-            team_id = team_match.group(1) if team_match else ""
-            team_abbrev = team_id_map.get(team_id, "???")
+            # Extract team ID from $ref URL (".../teams/<id>?lang=en")
+            team_id = team_ref.partition("/teams/")[2].split("?", 1)[0].split("/", 1)[0]
+            team_abbrev = team_id_map_get(team_id, "???")
 
             entries.append((value, athlete_ref, team_abbrev))
             if athlete_ref:
@@ -697,57 +880,183 @@ def get_b1g_leaders(team_id_map: dict) -> dict:
 
         raw[name] = entries
 
-    # Resolve athlete names
-    athlete_names = {}
-    for ref in athlete_refs:
+    # Resolve athlete names (one request per athlete, fetched concurrently)
+    def fetch_athlete_name(ref):
         try:
-            adata = fetch_json(ref)
-            athlete_names[ref] = adata.get("displayName", "Unknown")
+            return fetch_json(ref).get("displayName", "Unknown")
         except Exception:
-            athlete_names[ref] = "Unknown"
+            return "Unknown"
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        athlete_names = dict(zip(athlete_refs, executor.map(fetch_athlete_name, athlete_refs)))
 
-    # Build result in category order
+    # Build result in category order (target_cats insertion order)
+    athlete_names_get = athlete_names.get
     result = {}
-    for cat_name in cat_order:
-        if cat_name not in raw:
+    for cat_name, display in target_cats.items():
+        entries = raw.get(cat_name)
+        if entries is None:
             continue
-        display = target_cats[cat_name]
-        leaders = []
-        for value, athlete_ref, team_abbrev in raw[cat_name]:
-            leaders.append({
-                "name": athlete_names.get(athlete_ref, "Unknown"),
-                "team": team_abbrev,
-                "value": value,
-            })
-        result[display] = leaders
+        result[display] = [
+            {"name": athlete_names_get(athlete_ref, "Unknown"), "team": team_abbrev, "value": value}
+            for value, athlete_ref, team_abbrev in entries
+        ]
 
     return result
 
 
-def find_usc_game(scoreboard: dict, schedule: dict, team_id=USC_TEAM_ID) -> dict | None:
-    """Find team's live or recent game from scoreboard or schedule."""
-    # First check scoreboard
+# datetime.fromisoformat accepts a "Z" UTC suffix from Python 3.11
+FROMISOFORMAT_Z = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso(date_raw: str) -> datetime:
+    """Parse an ESPN ISO timestamp (e.g. "2026-01-15T03:00Z") into an aware datetime.
+
+    Cached, since the same event dates are parsed for several pages per run.
+    """
+    if FROMISOFORMAT_Z:
+        return datetime.fromisoformat(date_raw)
+    return datetime.fromisoformat(date_raw.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=4096)
+def format_pt(date_raw: str, fmt: str) -> str:
+    """Format an ESPN ISO timestamp in Pacific time with strftime(fmt)."""
+    return parse_iso(date_raw).astimezone(PT).strftime(fmt)
+
+
+@lru_cache(maxsize=512)
+def clock_elapsed(clock: str) -> int | None:
+    """Seconds elapsed in a 10-minute quarter for a "M:SS" game clock.
+
+    Returns None if the clock can't be parsed. Play clocks repeat a lot
+    within a game ("10:00", "0:00"), so results are cached.
+    """
+    try:
+        parts = clock.split(":")
+        minutes_left = int(parts[0])
+        seconds_left = int(parts[1]) if len(parts) > 1 else 0
+    except (AttributeError, ValueError):
+        return None
+    return 600 - (minutes_left * 60 + seconds_left)
+
+
+def rank_prefixes(rankings: dict) -> dict:
+    """Map each ranked team's abbreviation to its "#N " display prefix."""
+    return {abbrev: f"#{rank} " for abbrev, rank in rankings.items() if rank}
+
+
+def score_text(raw) -> str:
+    """Normalize a competitor score, which ESPN sends as a dict or a string."""
+    if isinstance(raw, dict):
+        return raw["displayValue"] if "displayValue" in raw else str(raw.get("value", ""))
+    return str(raw)
+
+
+def score_result(us_score: str, opp_score: str) -> str:
+    """Return "W", "L" or "-" (unparseable) for our score against the opponent's.
+
+    Scores are display strings (get_team_schedule normalizes ESPN's dict form).
+    """
+    try:
+        return "W" if float(us_score) > float(opp_score) else "L"
+    except Exception:
+        return "-"
+
+
+def split_competitors(competitors: list, team_id: str, default=None) -> tuple:
+    """Split competitors into (team, opponent) in a single pass.
+
+    Either side is `default` when not found (first match wins, as with next()).
+    """
+    us = opp = None
+    for c in competitors:
+        if c.get("team", {}).get("id") == team_id:
+            if us is None:
+                us = c
+        elif opp is None:
+            opp = c
+    return (default if us is None else us), (default if opp is None else opp)
+
+
+def split_home_away(competitors: list) -> tuple[dict, dict]:
+    """Split competitors into (home, away) in a single pass; missing sides are {}."""
+    home = away = None
+    for c in competitors:
+        home_away = c.get("homeAway")
+        if home_away == "home":
+            if home is None:
+                home = c
+        elif home_away == "away" and away is None:
+            away = c
+    return home or {}, away or {}
+
+
+def get_event_state(event: dict) -> str | None:
+    """Get an event's status state ("pre", "in", "post"), or None if missing."""
+    try:
+        return event["competitions"][0]["status"]["type"].get("state")
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return None
+
+
+def split_event_states(events: list) -> tuple[list, list, list]:
+    """Split schedule events into (completed, live, scheduled) in one pass, keeping order.
+
+    Reads each event's state once; events with an empty state land in none of them.
+    """
+    completed = []
+    live = []
+    scheduled = []
+    for e in events:
+        state = get_event_state(e)
+        if state == "post":
+            completed.append(e)
+        elif state == "pre":
+            scheduled.append(e)
+        elif state != "":
+            live.append(e)
+    return completed, live, scheduled
+
+
+def index_scoreboard(scoreboard: dict) -> dict:
+    """Map each team ID on the scoreboard to its first {"event", "competition"}."""
+    index = {}
     for event in scoreboard.get("events", []):
-        competitions = event.get("competitions", [])
-        for comp in competitions:
-            competitors = comp.get("competitors", [])
-            for c in competitors:
+        for comp in event.get("competitions", []):
+            for c in comp.get("competitors", []):
                 c_team_id = c.get("team", {}).get("id", "")
-                if c_team_id == team_id:
-                    return {"event": event, "competition": comp}
+                if c_team_id not in index:
+                    index[c_team_id] = {"event": event, "competition": comp}
+    return index
+
+
+def find_usc_game(scoreboard: dict, schedule: dict, team_id=USC_TEAM_ID,
+                  scoreboard_index: dict | None = None) -> dict | None:
+    """Find team's live or recent game from scoreboard or schedule.
+
+    Pass scoreboard_index (from index_scoreboard) when looking up several
+    teams on the same scoreboard to avoid rescanning it each time.
+    """
+    # First check scoreboard
+    if scoreboard_index is None:
+        scoreboard_index = index_scoreboard(scoreboard)
+    found = scoreboard_index.get(team_id)
+    if found:
+        return dict(found)
 
     # Also check schedule for live game (not always on scoreboard)
     for event in schedule.get("events", []):
-        comp = event.get("competitions", [{}])[0]
-        status = comp.get("status", {}).get("type", {})
-        state = status.get("state", "")
+        state = get_event_state(event) or ""
         if state not in ("pre", "post", ""):  # Game in progress (covers "in", halftime, etc.)
-            return {"event": event, "competition": comp}
+            return {"event": event, "competition": event.get("competitions", [{}])[0]}
 
     return None
 
 
-def is_game_live_or_imminent(schedule: dict, scoreboard: dict, team_id=USC_TEAM_ID) -> tuple[bool, str]:
+def is_game_live_or_imminent(schedule: dict, scoreboard: dict, team_id=USC_TEAM_ID,
+                             scoreboard_index: dict | None = None) -> tuple[bool, str]:
     """
     Check if a team has a game that is:
     - Currently in progress
@@ -758,7 +1067,7 @@ def is_game_live_or_imminent(schedule: dict, scoreboard: dict, team_id=USC_TEAM_
     now = datetime.now(timezone.utc)  # Use UTC for comparison since ESPN uses UTC
 
     # First check scoreboard and schedule for live game
-    usc_game = find_usc_game(scoreboard, schedule, team_id=team_id)
+    usc_game = find_usc_game(scoreboard, schedule, team_id=team_id, scoreboard_index=scoreboard_index)
     if usc_game:
         state = usc_game["competition"].get("status", {}).get("type", {}).get("state", "")
         if state == "post":
@@ -771,18 +1080,16 @@ def is_game_live_or_imminent(schedule: dict, scoreboard: dict, team_id=USC_TEAM_
     # Check schedule for upcoming games
     events = schedule.get("events", [])
     for event in events:
-        comp = event.get("competitions", [{}])[0]
-        status = comp.get("status", {}).get("type", {})
-        state = status.get("state", "")
+        state = get_event_state(event) or ""
 
         if state not in ("pre", "post", ""):
             return True, "Game is LIVE"
 
         if state == "pre":
-            date_str = comp.get("date", "")
+            date_str = event.get("competitions", [{}])[0].get("date", "")
             if date_str:
                 try:
-                    game_time = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                    game_time = parse_iso(date_str)
                     time_until = game_time - now
                     minutes_until = time_until.total_seconds() / 60
 
@@ -797,50 +1104,255 @@ def is_game_live_or_imminent(schedule: dict, scoreboard: dict, team_id=USC_TEAM_
     return False, "No game live or imminent"
 
 
-def generate_game_html(game_data: dict | None, schedule_data: dict, rankings: dict, roster: list,
-                       team_id=USC_TEAM_ID, team_abbrev="USC", home_page="index.html", schedule_page="schedule.html",
-                       games_dir="games",
-                       other_game_data: dict | None = None, other_schedule: dict | None = None,
-                       other_team_id=None, other_team_abbrev="", other_games_dir="",
-                       prior_rosters: dict | None = None) -> str:
-    """Generate the main game page HTML."""
-    now = datetime.now(PT)
-    now_str = now.strftime("%I:%M:%S %p")
-    now_iso = now.isoformat()
-
-    content_lines = []
-    content_lines.append(f'<span id="timestamps">Data loaded: {now_str}</span>')
-    content_lines.append("")
-    if team_abbrev == "USC":
-        content_lines.append('<b>USC</b>  <a href="nu.html">NU</a>  <a href="b1g.html">B1G</a>')
-    else:
-        content_lines.append('<a href="index.html">USC</a>  <b>NU</b>  <a href="b1g.html">B1G</a>')
-    content_lines.append("")
-    content_lines.append(f'<a href="{schedule_page}">Full Schedule/Results</a>')
-    content_lines.append("")
-    content_lines.append(f'<span id="year-nav"><b>2025-26</b> | <a href="javascript:void(0)" onclick="showSeason(\'2025\')">2024-25</a> | <a href="javascript:void(0)" onclick="showSeason(\'2024\')">2023-24</a></span>')
-    content_lines.append("")
-    content_lines.append("=" * 47)
+# Shared HTML page shell. Styles and scripts are plain strings (no f-string
+# brace escaping), published as site.css/site.js by write_site_assets.
+PAGE_CSS = """\
+        * {
+            box-sizing: border-box;
+        }
+        body {
+            font-family: monospace;
+            background: #ffffff;
+            color: #1a1a1a;
+            padding: 16px;
+            max-width: 100%;
+            margin: 0 auto;
+            line-height: 1.4;
+            overflow-x: auto;
+        }
+        pre {
+            white-space: pre;
+            min-width: 65ch;
+            margin: 0;
+            font-size: 12px;
+        }
+        a {
+            color: #0066cc;
+        }
+"""
 
-    # Build list of today's games across both teams
-    # Each entry: (sort_key, abbrev, matchup, status_str)
-    #   matchup = "at Illinois" or "vs Iowa"
-    #   status_str = "LIVE 2nd 8:58 70-62" (with HTML) or "5:00 PM"
-    today_pt = now.date()
-    today_games = []
+ROW_CSS = """\
+        .row-even {
+            background: #f0f0f0;
+            display: block;
+            margin: 0 -16px;
+            padding: 0 16px;
+        }
+        .row-odd {
+            background: transparent;
+            display: block;
+            margin: 0 -16px;
+            padding: 0 16px;
+        }
+"""
 
-    teams_info = [(team_id, team_abbrev, games_dir, game_data, schedule_data)]
-    if other_schedule is not None and other_team_id is not None:
-        teams_info.append((other_team_id, other_team_abbrev, other_games_dir, other_game_data, other_schedule))
+# Keeps the "Page loaded / Data loaded" lines current (every page)
+TIMESTAMP_JS = """\
+(function() {
+    const dataLoaded = new Date(document.querySelector('meta[name="data-loaded"]').content);
+    const pageLoaded = new Date();
 
-    for t_id, t_abbrev, t_games_dir, t_game_data, t_schedule in teams_info:
-        # Check for live game
-        if t_game_data:
-            comp = t_game_data["competition"]
-            eid = t_game_data["event"].get("id", "")
-            state = comp.get("status", {}).get("type", {}).get("state", "")
+    function formatTime(date) {
+        return date.toLocaleTimeString('en-US', { hour: 'numeric', minute: '2-digit', second: '2-digit', hour12: true });
+    }
 
-            if state not in ("pre", "post", ""):
+    function timeAgo(date) {
+        const seconds = Math.floor((new Date() - date) / 1000);
+        if (seconds < 60) return 'just now';
+        const minutes = Math.floor(seconds / 60);
+        if (minutes < 60) return minutes + ' min ago';
+        const hours = Math.floor(minutes / 60);
+        if (hours < 24) return hours + ' hr ago';
+        const days = Math.floor(hours / 24);
+        return days + ' day' + (days > 1 ? 's' : '') + ' ago';
+    }
+
+    function updateTimestamps() {
+        const el = document.getElementById('timestamps');
+        if (el) {
+            const pageLoadedStr = 'Page loaded: ' + formatTime(pageLoaded);
+            const pageAgo = '(' + timeAgo(pageLoaded) + ')';
+            const pagePadding = 65 - pageLoadedStr.length - pageAgo.length;
+            const pageSpaces = pagePadding > 0 ? ' '.repeat(pagePadding) : ' ';
+
+            const dataLoadedStr = 'Data loaded: ' + formatTime(dataLoaded);
+            const dataAgo = '(' + timeAgo(dataLoaded) + ')';
+            const dataPadding = 65 - dataLoadedStr.length - dataAgo.length;
+            const dataSpaces = dataPadding > 0 ? ' '.repeat(dataPadding) : ' ';
+
+            el.innerHTML = pageLoadedStr + pageSpaces + pageAgo + '\\n' + dataLoadedStr + dataSpaces + dataAgo;
+        }
+    }
+
+    updateTimestamps();
+    setInterval(updateTimestamps, 60000); // Update every minute
+})();
+"""
+
+# Season stats mode and season toggles (home pages)
+HOME_PAGE_JS = """\
+function showStats(view) {
+    ['totals','pergame','per40','per100'].forEach(function(v) {
+        document.getElementById('stats-' + v).style.display = v === view ? '' : 'none';
+    });
+}
+function showStats_2025(view) {
+    ['totals','pergame','per40','per100'].forEach(function(v) {
+        document.getElementById('stats-' + v + '-2025').style.display = v === view ? '' : 'none';
+    });
+}
+function showStats_2024(view) {
+    ['totals','pergame','per40','per100'].forEach(function(v) {
+        document.getElementById('stats-' + v + '-2024').style.display = v === view ? '' : 'none';
+    });
+}
+function showSeason(year) {
+    ['2026','2025','2024'].forEach(function(y) {
+        var el = document.getElementById('season-' + y);
+        if (el) el.style.display = y === year ? '' : 'none';
+    });
+    var nav = document.getElementById('year-nav');
+    if (nav) {
+        var labels = {'2026': '2025-26', '2025': '2024-25', '2024': '2023-24'};
+        var parts = [];
+        ['2026','2025','2024'].forEach(function(y) {
+            if (y === year) {
+                parts.push('<b>' + labels[y] + '</b>');
+            } else {
+                parts.push('<a href="javascript:void(0)" onclick="showSeason(\\\'' + y + '\\\')">' + labels[y] + '</a>');
+            }
+        });
+        nav.innerHTML = parts.join(' | ');
+    }
+}
+"""
+
+
+# Shared stylesheet and script, written next to the pages as site.css/site.js
+# so browsers fetch them once instead of with every page
+SITE_CSS = textwrap.dedent(PAGE_CSS + ROW_CSS)
+SITE_JS = TIMESTAMP_JS + HOME_PAGE_JS
+
+
+def write_site_assets(site_dir: Path):
+    """Write site.css and site.js into site_dir (skipped when unchanged)."""
+    for name, text in (("site.css", SITE_CSS), ("site.js", SITE_JS)):
+        path = site_dir / name
+        data = text.encode()
+        try:
+            if path.read_bytes() == data:
+                continue
+        except OSError:
+            pass
+        path.write_bytes(data)
+
+
+# Horizontal rules framing page sections (pages are 47 characters wide)
+SECTION_RULE = "=" * 47
+SUBSECTION_RULE = "-" * 47
+
+# Blank run sliced for computed padding in the game page layout; fixed-width
+# cells use str.rjust/ljust, which skip f-string format-spec parsing
+SPACES = " " * 256
+
+PAGE_HEAD = ('<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n'
+             '    <meta name="viewport" content="width=700">')
+
+
+@lru_cache(maxsize=4)
+def page_timestamps(now: datetime) -> tuple[str, str]:
+    """Return (display time, ISO timestamp) for a page's "Data loaded" line and meta tag."""
+    return now.strftime("%I:%M:%S %p"), now.isoformat()
+
+
+def render_page(title: str, now_iso: str, content_lines: list, css: str = "", js: str = "",
+                asset_prefix: str = "", game_key: str = "") -> bytes:
+    """Wrap content lines in the shared HTML shell and return UTF-8 bytes.
+
+    The page links site.css/site.js (asset_prefix is "../" for pages in a
+    subdirectory); css and js are page-specific additions emitted inline.
+    game_key, if set, is stamped in a meta tag (see game_page_key).
+    The lines are joined directly into the document, so there is no
+    intermediate content string, and the result is written with write_bytes.
+    """
+    head_style = f'    <style>\n{css}    </style>\n' if css else ''
+    key_meta = f'    <meta name="game-key" content="{game_key}">\n' if game_key else ''
+    page_script = f'<script>\n{js}</script>\n' if js else ''
+    return "\n".join([
+        PAGE_HEAD,
+        f'    <title>{title}</title>\n'
+        f'    <meta name="data-loaded" content="{now_iso}">\n'
+        f'{key_meta}'
+        f'    <link rel="stylesheet" href="{asset_prefix}site.css">\n'
+        f'{head_style}</head>\n<body>\n<pre>',
+        *content_lines,
+        f'</pre>\n<script src="{asset_prefix}site.js"></script>\n{page_script}</body>\n</html>\n',
+    ]).encode()
+
+
+# Zebra striping classes, indexed by row_idx & 1
+ROW_CLASSES = ("row-even", "row-odd")
+
+
+def pct_cell(made: int, att: int, width: int) -> str:
+    """Shooting percentage like " 45.45%" right-aligned in width columns, "--" if no attempts."""
+    if att > 0:
+        return "%*.2f%%" % (width - 1, 100 * made / att)
+    return "--".rjust(width)
+
+# Home page season stats rows: name line with grey percentages, then the
+# counting stats. Totals show integers; per game/40/100 show one decimal.
+SEASON_TOTALS_ROW = ('<span class="%s">%-33s<span style="color:#999">%-9s%-9s%-8s%5s </span>\n'
+                     '%4s%4s%4s%4s%4s%4s%4s%4s%9s%9s%8s%6s </span>')
+SEASON_RATE_ROW = ('<span class="%s">%-33s<span style="color:#999">%-9s%-9s%-8s%5s </span>\n'
+                   '%4s%4.1f%4.1f%4.1f%4.1f%4.1f%4.1f%4.1f%9s%9s%8s%6.1f </span>')
+
+
+def generate_game_html(game_data: dict | None, schedule_data: dict, rankings: dict, roster: list,
+                       team_id=USC_TEAM_ID, team_abbrev="USC", home_page="index.html", schedule_page="schedule.html",
+                       games_dir="games",
+                       other_game_data: dict | None = None, other_schedule: dict | None = None,
+                       other_team_id=None, other_team_abbrev="", other_games_dir="",
+                       prior_rosters: dict | None = None, now: datetime | None = None) -> bytes:
+    """Generate the main game page HTML."""
+    if now is None:
+        now = datetime.now(PT)
+    now_str, now_iso = page_timestamps(now)
+
+    content_lines = []
+    rank_prefix = rank_prefixes(rankings)
+    content_lines.append(f'<span id="timestamps">Data loaded: {now_str}</span>')
+    content_lines.append("")
+    if team_abbrev == "USC":
+        content_lines.append('<b>USC</b>  <a href="nu.html">NU</a>  <a href="b1g.html">B1G</a>')
+    else:
+        content_lines.append('<a href="index.html">USC</a>  <b>NU</b>  <a href="b1g.html">B1G</a>')
+    content_lines.append("")
+    content_lines.append(f'<a href="{schedule_page}">Full Schedule/Results</a>')
+    content_lines.append("")
+    content_lines.append(f'<span id="year-nav"><b>2025-26</b> | <a href="javascript:void(0)" onclick="showSeason(\'2025\')">2024-25</a> | <a href="javascript:void(0)" onclick="showSeason(\'2024\')">2023-24</a></span>')
+    content_lines.append("")
+    content_lines.append(SECTION_RULE)
+
+    # Build list of today's games across both teams
+    # Each entry: (sort_key, abbrev, matchup, status_str)
+    #   matchup = "at Illinois" or "vs Iowa"
+    #   status_str = "LIVE 2nd 8:58 70-62" (with HTML) or "5:00 PM"
+    today_pt = now.date()
+    today_games = []
+
+    teams_info = [(team_id, team_abbrev, games_dir, game_data, schedule_data)]
+    if other_schedule is not None and other_team_id is not None:
+        teams_info.append((other_team_id, other_team_abbrev, other_games_dir, other_game_data, other_schedule))
+
+    for t_id, t_abbrev, t_games_dir, t_game_data, t_schedule in teams_info:
+        # Check for live game
+        if t_game_data:
+            comp = t_game_data["competition"]
+            eid = t_game_data["event"].get("id", "")
+            state = comp.get("status", {}).get("type", {}).get("state", "")
+
+            if state not in ("pre", "post", ""):
                 try:
                     summary = get_game_summary(eid)
                     summary_comps = summary.get("header", {}).get("competitions", [])
@@ -859,8 +1371,7 @@ def generate_game_html(game_data: dict | None, schedule_data: dict, rankings: di
                     clock = ""
 
                 competitors = comp.get("competitors", [])
-                us = next((c for c in competitors if c.get("team", {}).get("id") == t_id), {})
-                opp = next((c for c in competitors if c.get("team", {}).get("id") != t_id), {})
+                us, opp = split_competitors(competitors, t_id, {})
                 our_score = us.get("score", "0")
                 opp_score = opp.get("score", "0")
                 opp_name = opp.get("team", {}).get("location", opp.get("team", {}).get("abbreviation", "OPP"))
@@ -875,20 +1386,18 @@ def generate_game_html(game_data: dict | None, schedule_data: dict, rankings: di
 
         # Check schedule for today's pregame
         for sched_event in t_schedule.get("events", []):
-            sched_comp = sched_event.get("competitions", [{}])[0]
-            sched_state = sched_comp.get("status", {}).get("type", {}).get("state", "")
-            if sched_state != "pre":
+            if get_event_state(sched_event) != "pre":
                 continue
+            sched_comp = sched_event.get("competitions", [{}])[0]
             date_str = sched_comp.get("date", "")
             if not date_str:
                 continue
             try:
-                game_time_utc = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                game_time_utc = parse_iso(date_str)
                 game_time_pt = game_time_utc.astimezone(PT)
                 if game_time_pt.date() == today_pt:
                     sched_competitors = sched_comp.get("competitors", [])
-                    us = next((c for c in sched_competitors if c.get("team", {}).get("id") == t_id), {})
-                    opp = next((c for c in sched_competitors if c.get("team", {}).get("id") != t_id), {})
+                    us, opp = split_competitors(sched_competitors, t_id, {})
                     opp_name = opp.get("team", {}).get("location", opp.get("team", {}).get("abbreviation", "OPP"))
                     home_away = "vs" if us.get("homeAway") == "home" else "at"
                     time_str = game_time_pt.strftime("%-I:%M %p")
@@ -915,12 +1424,13 @@ def generate_game_html(game_data: dict | None, schedule_data: dict, rankings: di
     # Show player season stats
     if roster:
         content_lines.append("")
-        content_lines.append("=" * 47)
+        content_lines.append(SECTION_RULE)
         team_color = "990000" if team_abbrev == "USC" else "4E2A84"
 
-        def build_stats_block(mode, block_roster, season_suffix=""):
-            """Build a stats block for the given mode: 'totals', 'pergame', 'per40', 'per100'.
+        def build_stats_block(mode, block_roster, out, season_suffix=""):
+            """Append a stats block for the given mode: 'totals', 'pergame', 'per40', 'per100'.
 
+            out: list the block's row spans are appended to.
             season_suffix: e.g. '-2025' for prior seasons, '' for current.
             """
             js_fn = f"showStats{season_suffix.replace('-', '_')}" if season_suffix else "showStats"
@@ -938,17 +1448,16 @@ def generate_game_html(game_data: dict | None, schedule_data: dict, rankings: di
             else:
                 stats_header = "  GP ORB DRB AST STL BLK  TO FLS       FG      3PT      FT   PTS"
 
-            all_spans = []
+            all_spans = out
             row_idx = 0
-            row_class = "row-even" if row_idx % 2 == 0 else "row-odd"
+            row_class = ROW_CLASSES[row_idx & 1]
             all_spans.append(f'<span class="{row_class}" style="color: #{team_color};"><b>{team_abbrev} SEASON STATS</b>  {toggle_line}\n{stats_header}</span>')
             row_idx += 1
 
             for p in block_roster:
                 name = p.get("name", "")
                 jersey = p.get("jersey", "")
-                jersey_str = f"#{jersey}" if jersey else ""
-                name_part = f"{name} {jersey_str}"
+                name_part = f"{name} #{jersey}" if jersey else f"{name} "
 
                 gp = p.get("gp", 0)
                 mins = p.get("min", 0)
@@ -977,118 +1486,72 @@ def generate_game_html(game_data: dict | None, schedule_data: dict, rankings: di
                 if mode == "per100" and (gp == 0 or poss == 0):
                     continue
 
+                row_class = ROW_CLASSES[row_idx & 1]
+
+                # Percentages in grey
+                fg_pct = pct_cell(fg_made, fg_att, 7)
+                three_pct = pct_cell(three_made, three_att, 7)
+                ft_pct = pct_cell(ft_made, ft_att, 7)
+
                 if mode == "totals":
-                    # Percentages in grey
-                    fg_pct = f"{f'{100 * fg_made / fg_att:.2f}%':>7}" if fg_att > 0 else "     --"
-                    three_pct = f"{f'{100 * three_made / three_att:.2f}%':>7}" if three_att > 0 else "     --"
-                    ft_pct = f"{f'{100 * ft_made / ft_att:.2f}%':>7}" if ft_att > 0 else "     --"
                     pm_str = f"+{pm_val}" if pm_val > 0 else str(pm_val)
-                    grey_part = f"{fg_pct:<9}{three_pct:<9}{ft_pct:<8}{pm_str:>5} "
-                    name_line = f'{name_part:<33}<span style="color:#999">{grey_part}</span>'
-
-                    fg_str = f"{fg_made}/{fg_att}"
-                    three_str = f"{three_made}/{three_att}"
-                    ft_str = f"{ft_made}/{ft_att}"
-                    stats_line = f"{mins:>4}{orb:>4}{drb:>4}{ast:>4}{stl:>4}{blk:>4}{to:>4}{fls:>4}{fg_str:>9}{three_str:>9}{ft_str:>8}{pts:>6} "
-                elif mode == "pergame":
-                    d = gp
-                    s_orb = orb / d; s_drb = drb / d; s_ast = ast / d
-                    s_stl = stl / d; s_blk = blk / d; s_to = to / d; s_fls = fls / d
-                    s_pts = pts / d; s_pm = pm_val / d
-                    s_fg_made = fg_made / d; s_fg_att = fg_att / d
-                    s_three_made = three_made / d; s_three_att = three_att / d
-                    s_ft_made = ft_made / d; s_ft_att = ft_att / d
-
-                    fg_pct = f"{f'{100 * fg_made / fg_att:.2f}%':>7}" if fg_att > 0 else "     --"
-                    three_pct = f"{f'{100 * three_made / three_att:.2f}%':>7}" if three_att > 0 else "     --"
-                    ft_pct = f"{f'{100 * ft_made / ft_att:.2f}%':>7}" if ft_att > 0 else "     --"
-                    pm_str = f"+{s_pm:.1f}" if s_pm > 0 else f"{s_pm:.1f}"
-                    grey_part = f"{fg_pct:<9}{three_pct:<9}{ft_pct:<8}{pm_str:>5} "
-                    name_line = f'{name_part:<33}<span style="color:#999">{grey_part}</span>'
-
-                    fg_str = f"{s_fg_made:.1f}/{s_fg_att:.1f}"
-                    three_str = f"{s_three_made:.1f}/{s_three_att:.1f}"
-                    ft_str = f"{s_ft_made:.1f}/{s_ft_att:.1f}"
-                    stats_line = f"{gp:>4}{s_orb:>4.1f}{s_drb:>4.1f}{s_ast:>4.1f}{s_stl:>4.1f}{s_blk:>4.1f}{s_to:>4.1f}{s_fls:>4.1f}{fg_str:>9}{three_str:>9}{ft_str:>8}{s_pts:>6.1f} "
-                elif mode == "per40":
-                    d = mins / 40
-                    s_orb = orb / d; s_drb = drb / d; s_ast = ast / d
-                    s_stl = stl / d; s_blk = blk / d; s_to = to / d; s_fls = fls / d
-                    s_pts = pts / d; s_pm = pm_val / d
-                    s_fg_made = fg_made / d; s_fg_att = fg_att / d
-                    s_three_made = three_made / d; s_three_att = three_att / d
-                    s_ft_made = ft_made / d; s_ft_att = ft_att / d
-
-                    fg_pct = f"{f'{100 * fg_made / fg_att:.2f}%':>7}" if fg_att > 0 else "     --"
-                    three_pct = f"{f'{100 * three_made / three_att:.2f}%':>7}" if three_att > 0 else "     --"
-                    ft_pct = f"{f'{100 * ft_made / ft_att:.2f}%':>7}" if ft_att > 0 else "     --"
-                    pm_str = f"+{s_pm:.1f}" if s_pm > 0 else f"{s_pm:.1f}"
-                    grey_part = f"{fg_pct:<9}{three_pct:<9}{ft_pct:<8}{pm_str:>5} "
-                    name_line = f'{name_part:<33}<span style="color:#999">{grey_part}</span>'
-
-                    fg_str = f"{s_fg_made:.1f}/{s_fg_att:.1f}"
-                    three_str = f"{s_three_made:.1f}/{s_three_att:.1f}"
-                    ft_str = f"{s_ft_made:.1f}/{s_ft_att:.1f}"
-                    stats_line = f"{gp:>4}{s_orb:>4.1f}{s_drb:>4.1f}{s_ast:>4.1f}{s_stl:>4.1f}{s_blk:>4.1f}{s_to:>4.1f}{s_fls:>4.1f}{fg_str:>9}{three_str:>9}{ft_str:>8}{s_pts:>6.1f} "
-                else:  # per100
-                    d = poss / 100
-                    s_orb = orb / d; s_drb = drb / d; s_ast = ast / d
-                    s_stl = stl / d; s_blk = blk / d; s_to = to / d; s_fls = fls / d
-                    s_pts = pts / d; s_pm = pm_val / d
-                    s_fg_made = fg_made / d; s_fg_att = fg_att / d
-                    s_three_made = three_made / d; s_three_att = three_att / d
-                    s_ft_made = ft_made / d; s_ft_att = ft_att / d
-
-                    fg_pct = f"{f'{100 * fg_made / fg_att:.2f}%':>7}" if fg_att > 0 else "     --"
-                    three_pct = f"{f'{100 * three_made / three_att:.2f}%':>7}" if three_att > 0 else "     --"
-                    ft_pct = f"{f'{100 * ft_made / ft_att:.2f}%':>7}" if ft_att > 0 else "     --"
-                    pm_str = f"+{s_pm:.1f}" if s_pm > 0 else f"{s_pm:.1f}"
-                    grey_part = f"{fg_pct:<9}{three_pct:<9}{ft_pct:<8}{pm_str:>5} "
-                    name_line = f'{name_part:<33}<span style="color:#999">{grey_part}</span>'
-
-                    fg_str = f"{s_fg_made:.1f}/{s_fg_att:.1f}"
-                    three_str = f"{s_three_made:.1f}/{s_three_att:.1f}"
-                    ft_str = f"{s_ft_made:.1f}/{s_ft_att:.1f}"
-                    stats_line = f"{gp:>4}{s_orb:>4.1f}{s_drb:>4.1f}{s_ast:>4.1f}{s_stl:>4.1f}{s_blk:>4.1f}{s_to:>4.1f}{s_fls:>4.1f}{fg_str:>9}{three_str:>9}{ft_str:>8}{s_pts:>6.1f} "
-
-                row_class = "row-even" if row_idx % 2 == 0 else "row-odd"
-                all_spans.append(f'<span class="{row_class}">{name_line}\n{stats_line}</span>')
+                    all_spans.append(SEASON_TOTALS_ROW % (
+                        row_class, name_part, fg_pct, three_pct, ft_pct, pm_str,
+                        mins, orb, drb, ast, stl, blk, to, fls,
+                        f"{fg_made}/{fg_att}", f"{three_made}/{three_att}", f"{ft_made}/{ft_att}", pts))
+                else:
+                    if mode == "pergame":
+                        d = gp
+                    elif mode == "per40":
+                        d = mins / 40
+                    else:  # per100
+                        d = poss / 100
+                    s_pm = pm_val / d
+                    pm_str = ("+%.1f" if s_pm > 0 else "%.1f") % s_pm
+                    all_spans.append(SEASON_RATE_ROW % (
+                        row_class, name_part, fg_pct, three_pct, ft_pct, pm_str,
+                        gp, orb / d, drb / d, ast / d, stl / d, blk / d, to / d, fls / d,
+                        "%.1f/%.1f" % (fg_made / d, fg_att / d),
+                        "%.1f/%.1f" % (three_made / d, three_att / d),
+                        "%.1f/%.1f" % (ft_made / d, ft_att / d),
+                        pts / d))
                 row_idx += 1
 
-            return "".join(all_spans)
+        # All season blocks are streamed into one list and joined once
+        season_parts = []
+
+        def append_season_block(year, block_roster, season_suffix="", hidden=False):
+            season_style = ' style="display:none"' if hidden else ''
+            season_parts.append(f'<span id="season-{year}"{season_style}>')
+            for mode in ("totals", "pergame", "per40", "per100"):
+                mode_style = '' if mode == "totals" else ' style="display:none"'
+                season_parts.append(f'<span id="stats-{mode}{season_suffix}"{mode_style}>')
+                build_stats_block(mode, block_roster, season_parts, season_suffix)
+                season_parts.append('</span>')
+            season_parts.append('</span>')
 
         # Current season stats (season 2026)
-        totals_block = f'<span id="stats-totals">{build_stats_block("totals", roster)}</span>'
-        pergame_block = f'<span id="stats-pergame" style="display:none">{build_stats_block("pergame", roster)}</span>'
-        per40_block = f'<span id="stats-per40" style="display:none">{build_stats_block("per40", roster)}</span>'
-        per100_block = f'<span id="stats-per100" style="display:none">{build_stats_block("per100", roster)}</span>'
-        current_season_block = f'<span id="season-2026">{totals_block}{pergame_block}{per40_block}{per100_block}</span>'
+        append_season_block(2026, roster)
 
         # Prior season stats blocks (hidden by default)
-        prior_season_blocks = ""
         if prior_rosters:
             for year in [2025, 2024]:
                 pr = prior_rosters.get(year, [])
                 if not pr:
                     continue
-                suffix = f"-{year}"
-                t_block = f'<span id="stats-totals{suffix}">{build_stats_block("totals", pr, suffix)}</span>'
-                pg_block = f'<span id="stats-pergame{suffix}" style="display:none">{build_stats_block("pergame", pr, suffix)}</span>'
-                p40_block = f'<span id="stats-per40{suffix}" style="display:none">{build_stats_block("per40", pr, suffix)}</span>'
-                p100_block = f'<span id="stats-per100{suffix}" style="display:none">{build_stats_block("per100", pr, suffix)}</span>'
-                prior_season_blocks += f'<span id="season-{year}" style="display:none">{t_block}{pg_block}{p40_block}{p100_block}</span>'
+                append_season_block(year, pr, f"-{year}", hidden=True)
 
-        content_lines.append(current_season_block + prior_season_blocks)
+        content_lines.append("".join(season_parts))
 
     events = schedule_data.get("events", [])
 
     # Recent results
     content_lines.append("\n")
-    content_lines.append("=" * 47)
+    content_lines.append(SECTION_RULE)
     content_lines.append("RECENT RESULTS")
-    content_lines.append("-" * 47)
+    content_lines.append(SUBSECTION_RULE)
 
-    completed = [e for e in events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") == "post"]
+    completed, _, upcoming = split_event_states(events)
 
     for event in completed[-5:]:
         event_id = event.get("id", "")
@@ -1096,7 +1559,7 @@ def generate_game_html(game_data: dict | None, schedule_data: dict, rankings: di
         date_raw = comp.get("date", "")
         if date_raw:
             try:
-                dt = datetime.fromisoformat(date_raw.replace("Z", "+00:00"))
+                dt = parse_iso(date_raw)
                 date_str = dt.strftime("%b %d")
             except Exception:
                 date_str = date_raw[:10]
@@ -1104,33 +1567,16 @@ def generate_game_html(game_data: dict | None, schedule_data: dict, rankings: di
             date_str = ""
 
         competitors = comp.get("competitors", [])
-        usc = next((c for c in competitors if c.get("team", {}).get("id") == team_id), None)
-        opponent = next((c for c in competitors if c.get("team", {}).get("id") != team_id), None)
+        usc, opponent = split_competitors(competitors, team_id)
 
         if usc and opponent:
-            usc_score_raw = usc.get("score", "")
-            opp_score_raw = opponent.get("score", "")
+            usc_score = usc.get("score", "")
+            opp_score = opponent.get("score", "")
             opp_abbrev = opponent.get("team", {}).get("abbreviation", "OPP")
-
-            # Handle score being a dict or string
-            if isinstance(usc_score_raw, dict):
-                usc_score = usc_score_raw.get("displayValue", str(usc_score_raw.get("value", "")))
-            else:
-                usc_score = str(usc_score_raw)
-
-            if isinstance(opp_score_raw, dict):
-                opp_score = opp_score_raw.get("displayValue", str(opp_score_raw.get("value", "")))
-            else:
-                opp_score = str(opp_score_raw)
-
-            try:
-                result = "W" if float(usc_score) > float(opp_score) else "L"
-            except Exception:
-                result = "-"
+            result = score_result(usc_score, opp_score)
 
             # Add ranking if opponent is ranked
-            opp_rank = rankings.get(opp_abbrev, 0)
-            opp_str = f"#{opp_rank} {opp_abbrev}" if opp_rank else opp_abbrev
+            opp_str = rank_prefix.get(opp_abbrev, "") + opp_abbrev
 
             # Home vs away
             home_away = "vs" if opponent.get("homeAway") == "away" else "at"
@@ -1142,188 +1588,57 @@ def generate_game_html(game_data: dict | None, schedule_data: dict, rankings: di
     # Upcoming schedule
     content_lines.append("\n")
     content_lines.append("UPCOMING SCHEDULE")
-    content_lines.append("-" * 47)
+    content_lines.append(SUBSECTION_RULE)
 
-    upcoming = [e for e in events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") == "pre"]
+    usc_rank = rankings.get(team_abbrev, 0)
+    usc_str = f"(#{usc_rank})" if usc_rank else ""
 
     for event in upcoming[:5]:
         comp = event.get("competitions", [{}])[0]
         date_raw = comp.get("date", "")
         if date_raw:
             try:
-                dt = datetime.fromisoformat(date_raw.replace("Z", "+00:00"))
-                dt_pt = dt.astimezone(PT)
-                date_str = dt_pt.strftime("%a %b %d %I:%M%p PT")
+                date_str = format_pt(date_raw, "%a %b %d %I:%M%p PT")
             except Exception:
                 date_str = date_raw[:10]
         else:
             date_str = "TBD"
 
         competitors = comp.get("competitors", [])
-        opponent = next((c for c in competitors if c.get("team", {}).get("id") != team_id), None)
+        _, opponent = split_competitors(competitors, team_id)
         if opponent:
             opp_abbrev = opponent.get("team", {}).get("abbreviation", "OPP")
             home_away = "vs" if opponent.get("homeAway") == "away" else "at"
 
             # Get rankings from lookup
-            opp_rank = rankings.get(opp_abbrev, 0)
-            usc_rank = rankings.get(team_abbrev, 0)
-
-            opp_str = f"#{opp_rank} {opp_abbrev}" if opp_rank else opp_abbrev
-            usc_str = f"(#{usc_rank})" if usc_rank else ""
+            opp_str = rank_prefix.get(opp_abbrev, "") + opp_abbrev
 
             content_lines.append(f"{date_str} {home_away} {opp_str} {usc_str}".rstrip())
 
     content_lines.append(f"\n{VERSION}")
 
-    content = "\n".join(content_lines)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=700">
-    <title>{team_abbrev} Women's Basketball</title>
-    <meta name="data-loaded" content="{now_iso}">
-    <style>
-        * {{
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: monospace;
-            background: #ffffff;
-            color: #1a1a1a;
-            padding: 16px;
-            max-width: 100%;
-            margin: 0 auto;
-            line-height: 1.4;
-            overflow-x: auto;
-        }}
-        pre {{
-            white-space: pre;
-            min-width: 65ch;
-            margin: 0;
-            font-size: 12px;
-        }}
-        a {{
-            color: #0066cc;
-        }}
-        .row-even {{
-            background: #f0f0f0;
-            display: block;
-            margin: 0 -16px;
-            padding: 0 16px;
-        }}
-        .row-odd {{
-            background: transparent;
-            display: block;
-            margin: 0 -16px;
-            padding: 0 16px;
-        }}
-    </style>
-</head>
-<body>
-<pre>
-{content}
-</pre>
-<script>
-(function() {{
-    const dataLoaded = new Date(document.querySelector('meta[name="data-loaded"]').content);
-    const pageLoaded = new Date();
-
-    function formatTime(date) {{
-        return date.toLocaleTimeString('en-US', {{ hour: 'numeric', minute: '2-digit', second: '2-digit', hour12: true }});
-    }}
-
-    function timeAgo(date) {{
-        const seconds = Math.floor((new Date() - date) / 1000);
-        if (seconds < 60) return 'just now';
-        const minutes = Math.floor(seconds / 60);
-        if (minutes < 60) return minutes + ' min ago';
-        const hours = Math.floor(minutes / 60);
-        if (hours < 24) return hours + ' hr ago';
-        const days = Math.floor(hours / 24);
-        return days + ' day' + (days > 1 ? 's' : '') + ' ago';
-    }}
-
-    function updateTimestamps() {{
-        const el = document.getElementById('timestamps');
-        if (el) {{
-            const pageLoadedStr = 'Page loaded: ' + formatTime(pageLoaded);
-            const pageAgo = '(' + timeAgo(pageLoaded) + ')';
-            const pagePadding = 65 - pageLoadedStr.length - pageAgo.length;
-            const pageSpaces = pagePadding > 0 ? ' '.repeat(pagePadding) : ' ';
-
-            const dataLoadedStr = 'Data loaded: ' + formatTime(dataLoaded);
-            const dataAgo = '(' + timeAgo(dataLoaded) + ')';
-            const dataPadding = 65 - dataLoadedStr.length - dataAgo.length;
-            const dataSpaces = dataPadding > 0 ? ' '.repeat(dataPadding) : ' ';
-
-            el.innerHTML = pageLoadedStr + pageSpaces + pageAgo + '\\n' + dataLoadedStr + dataSpaces + dataAgo;
-        }}
-    }}
-
-    updateTimestamps();
-    setInterval(updateTimestamps, 60000); // Update every minute
-}})();
-function showStats(view) {{
-    ['totals','pergame','per40','per100'].forEach(function(v) {{
-        document.getElementById('stats-' + v).style.display = v === view ? '' : 'none';
-    }});
-}}
-function showStats_2025(view) {{
-    ['totals','pergame','per40','per100'].forEach(function(v) {{
-        document.getElementById('stats-' + v + '-2025').style.display = v === view ? '' : 'none';
-    }});
-}}
-function showStats_2024(view) {{
-    ['totals','pergame','per40','per100'].forEach(function(v) {{
-        document.getElementById('stats-' + v + '-2024').style.display = v === view ? '' : 'none';
-    }});
-}}
-function showSeason(year) {{
-    ['2026','2025','2024'].forEach(function(y) {{
-        var el = document.getElementById('season-' + y);
-        if (el) el.style.display = y === year ? '' : 'none';
-    }});
-    var nav = document.getElementById('year-nav');
-    if (nav) {{
-        var labels = {{'2026': '2025-26', '2025': '2024-25', '2024': '2023-24'}};
-        var parts = [];
-        ['2026','2025','2024'].forEach(function(y) {{
-            if (y === year) {{
-                parts.push('<b>' + labels[y] + '</b>');
-            }} else {{
-                parts.push('<a href="javascript:void(0)" onclick="showSeason(\\\'' + y + '\\\')">' + labels[y] + '</a>');
-            }}
-        }});
-        nav.innerHTML = parts.join(' | ');
-    }}
-}}
-</script>
-</body>
-</html>
-"""
-    return html
+    return render_page(f"{team_abbrev} Women's Basketball", now_iso, content_lines)
 
 
 def generate_schedule_html(schedule_data: dict, rankings: dict,
                            team_id=USC_TEAM_ID, team_abbrev="USC", home_page="index.html", games_dir="games",
-                           season_year=2026, schedule_page_base="schedule") -> str:
+                           season_year=2026, schedule_page_base="schedule", now: datetime | None = None) -> bytes:
     """Generate the full schedule/results page.
 
     Args:
         season_year: The season year (ESPN ending year, e.g. 2026 for 2025-26)
         schedule_page_base: Base name for schedule pages (e.g. "schedule" or "nu-schedule")
+        now: "Data loaded" time shown on the page (defaults to the current time)
     """
     CURRENT_YEAR = 2026
     YEARS = [2026, 2025, 2024]
 
-    now = datetime.now(PT)
-    now_str = now.strftime("%I:%M:%S %p")
-    now_iso = now.isoformat()
+    if now is None:
+        now = datetime.now(PT)
+    now_str, now_iso = page_timestamps(now)
 
     content_lines = []
+    rank_prefix = rank_prefixes(rankings)
     content_lines.append(f'<span id="timestamps">Data loaded: {now_str}</span>')
     content_lines.append("")
     if team_abbrev == "USC":
@@ -1349,17 +1664,19 @@ def generate_schedule_html(schedule_data: dict, rankings: dict,
     content_lines.append(" | ".join(year_parts))
     content_lines.append("")
     content_lines.append("Full Schedule/Results")
-    content_lines.append("=" * 47)
+    content_lines.append(SECTION_RULE)
 
     events = schedule_data.get("events", [])
 
-    # Split into completed and upcoming
-    completed = [e for e in events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") == "post"]
-    upcoming = [e for e in events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") != "post"]
+    # Split into completed and upcoming (everything not final, in schedule order)
+    completed = []
+    upcoming = []
+    for e in events:
+        (completed if get_event_state(e) == "post" else upcoming).append(e)
 
     # Results section
     content_lines.append("RESULTS")
-    content_lines.append("-" * 47)
+    content_lines.append(SUBSECTION_RULE)
 
     for event in completed:
         event_id = event.get("id", "")
@@ -1369,17 +1686,14 @@ def generate_schedule_html(schedule_data: dict, rankings: dict,
         date_raw = comp.get("date", "")
         if date_raw:
             try:
-                dt = datetime.fromisoformat(date_raw.replace("Z", "+00:00"))
-                dt_pt = dt.astimezone(PT)
-                date_str = dt_pt.strftime("%b %d")
+                date_str = format_pt(date_raw, "%b %d")
             except Exception:
                 date_str = date_raw[:10]
         else:
             date_str = "TBD"
 
         competitors = comp.get("competitors", [])
-        usc = next((c for c in competitors if c.get("team", {}).get("id") == team_id), None)
-        opponent = next((c for c in competitors if c.get("team", {}).get("id") != team_id), None)
+        usc, opponent = split_competitors(competitors, team_id)
 
         if not opponent:
             continue
@@ -1390,27 +1704,13 @@ def generate_schedule_html(schedule_data: dict, rankings: dict,
         home_away = "vs" if opponent.get("homeAway") == "away" else "at"
 
         # Ranking
-        opp_rank = rankings.get(opp_abbrev, 0)
-        opp_str = f"#{opp_rank} {opp_school}" if opp_rank else opp_school
+        opp_str = rank_prefix.get(opp_abbrev, "") + opp_school
 
         # Completed game
-        usc_score_raw = usc.get("score", "") if usc else ""
-        opp_score_raw = opponent.get("score", "")
-
-        if isinstance(usc_score_raw, dict):
-            usc_score = usc_score_raw.get("displayValue", str(usc_score_raw.get("value", "")))
-        else:
-            usc_score = str(usc_score_raw)
+        usc_score = usc.get("score", "") if usc else ""
+        opp_score = opponent.get("score", "")
 
-        if isinstance(opp_score_raw, dict):
-            opp_score = opp_score_raw.get("displayValue", str(opp_score_raw.get("value", "")))
-        else:
-            opp_score = str(opp_score_raw)
-
-        try:
-            result = "W" if float(usc_score) > float(opp_score) else "L"
-        except Exception:
-            result = "-"
+        result = score_result(usc_score, opp_score)
 
         score_link = f'<a href="{games_dir}/{event_id}.html">{result} {usc_score}-{opp_score}</a>'
         game_link = f'{date_str} {score_link} {home_away} {opp_str}'
@@ -1419,7 +1719,7 @@ def generate_schedule_html(schedule_data: dict, rankings: dict,
     # Upcoming section
     content_lines.append("")
     content_lines.append("UPCOMING SCHEDULE")
-    content_lines.append("-" * 47)
+    content_lines.append(SUBSECTION_RULE)
 
     for event in upcoming:
         comp = event.get("competitions", [{}])[0]
@@ -1430,16 +1730,14 @@ def generate_schedule_html(schedule_data: dict, rankings: dict,
         date_raw = comp.get("date", "")
         if date_raw:
             try:
-                dt = datetime.fromisoformat(date_raw.replace("Z", "+00:00"))
-                dt_pt = dt.astimezone(PT)
-                date_str = dt_pt.strftime("%b %d %I:%M%p")
+                date_str = format_pt(date_raw, "%b %d %I:%M%p")
             except Exception:
                 date_str = date_raw[:10]
         else:
             date_str = "TBD"
 
         competitors = comp.get("competitors", [])
-        opponent = next((c for c in competitors if c.get("team", {}).get("id") != team_id), None)
+        _, opponent = split_competitors(competitors, team_id)
 
         if not opponent:
             continue
@@ -1450,17 +1748,14 @@ def generate_schedule_html(schedule_data: dict, rankings: dict,
         home_away = "vs" if opponent.get("homeAway") == "away" else "at"
 
         # Ranking
-        opp_rank = rankings.get(opp_abbrev, 0)
-        opp_str = f"#{opp_rank} {opp_school}" if opp_rank else opp_school
+        opp_str = rank_prefix.get(opp_abbrev, "") + opp_school
 
         if state not in ("pre", "post", ""):
             event_id = event.get("id", "")
             # Replace game time with red "LIVE" label
             date_raw_dt = comp.get("date", "")
             try:
-                dt = datetime.fromisoformat(date_raw_dt.replace("Z", "+00:00"))
-                dt_pt = dt.astimezone(PT)
-                live_date = dt_pt.strftime("%b %d")
+                live_date = format_pt(date_raw_dt, "%b %d")
             except Exception:
                 live_date = date_str.split()[0] if date_str else ""
             content_lines.append(f'<a href="{games_dir}/{event_id}.html">{live_date} <span style="color: #cc0000; font-weight: bold;">LIVE</span> {home_away} {opp_str}</a>')
@@ -1469,108 +1764,38 @@ def generate_schedule_html(schedule_data: dict, rankings: dict,
 
     content_lines.append(f"\n{VERSION}")
 
-    content = "\n".join(content_lines)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=700">
-    <title>{team_abbrev} WBB Schedule {season_year-1}-{str(season_year)[2:]}</title>
-    <meta name="data-loaded" content="{now_iso}">
-    <style>
-        * {{
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: monospace;
-            background: #ffffff;
-            color: #1a1a1a;
-            padding: 16px;
-            max-width: 100%;
-            margin: 0 auto;
-            line-height: 1.4;
-            overflow-x: auto;
-        }}
-        pre {{
-            white-space: pre;
-            min-width: 65ch;
-            margin: 0;
-            font-size: 12px;
-        }}
-        a {{
-            color: #0066cc;
-        }}
-    </style>
-</head>
-<body>
-<pre>
-{content}
-</pre>
-<script>
-(function() {{
-    const dataLoaded = new Date(document.querySelector('meta[name="data-loaded"]').content);
-    const pageLoaded = new Date();
-
-    function formatTime(date) {{
-        return date.toLocaleTimeString('en-US', {{ hour: 'numeric', minute: '2-digit', second: '2-digit', hour12: true }});
-    }}
-
-    function timeAgo(date) {{
-        const seconds = Math.floor((new Date() - date) / 1000);
-        if (seconds < 60) return 'just now';
-        const minutes = Math.floor(seconds / 60);
-        if (minutes < 60) return minutes + ' min ago';
-        const hours = Math.floor(minutes / 60);
-        if (hours < 24) return hours + ' hr ago';
-        const days = Math.floor(hours / 24);
-        return days + ' day' + (days > 1 ? 's' : '') + ' ago';
-    }}
-
-    function updateTimestamps() {{
-        const el = document.getElementById('timestamps');
-        if (el) {{
-            const pageLoadedStr = 'Page loaded: ' + formatTime(pageLoaded);
-            const pageAgo = '(' + timeAgo(pageLoaded) + ')';
-            const pagePadding = 65 - pageLoadedStr.length - pageAgo.length;
-            const pageSpaces = pagePadding > 0 ? ' '.repeat(pagePadding) : ' ';
-
-            const dataLoadedStr = 'Data loaded: ' + formatTime(dataLoaded);
-            const dataAgo = '(' + timeAgo(dataLoaded) + ')';
-            const dataPadding = 65 - dataLoadedStr.length - dataAgo.length;
-            const dataSpaces = dataPadding > 0 ? ' '.repeat(dataPadding) : ' ';
+    title = f"{team_abbrev} WBB Schedule {season_year-1}-{str(season_year)[2:]}"
+    return render_page(title, now_iso, content_lines)
 
-            el.innerHTML = pageLoadedStr + pageSpaces + pageAgo + '\\n' + dataLoadedStr + dataSpaces + dataAgo;
-        }}
-    }}
 
-    updateTimestamps();
-    setInterval(updateTimestamps, 60000); // Update every minute
-}})();
-</script>
-</body>
-</html>
-"""
-    return html
+# Standings/leaders rows, highlighted in team colors for USC and NU.
+STANDINGS_ROW = "%2s  %-18s %7s %7s %5s"
+LEADERS_ROW = "%2s  %-21s %-7s %7s"
+SPAN_USC = '<span class="%s" style="color: #990000;"><b>%s</b></span>'
+SPAN_NU = '<span class="%s" style="color: #4E2A84;"><b>%s</b></span>'
+SPAN_DEFAULT = '<span class="%s">%s</span>'
+TEAM_SPANS = {"USC": SPAN_USC, "NU": SPAN_NU}
 
 
-def generate_standings_html(standings: list, rankings: dict, leaders: dict = None) -> str:
+def generate_standings_html(standings: list, rankings: dict, leaders: dict = None,
+                            now: datetime | None = None) -> bytes:
     """Generate B1G conference standings page."""
-    now = datetime.now(PT)
-    now_str = now.strftime("%I:%M:%S %p")
-    now_iso = now.isoformat()
+    if now is None:
+        now = datetime.now(PT)
+    now_str, now_iso = page_timestamps(now)
 
     content_lines = []
+    rank_prefix = rank_prefixes(rankings)
     content_lines.append(f'<span id="timestamps">Data loaded: {now_str}</span>')
     content_lines.append("")
     content_lines.append('<a href="index.html">USC</a>  <a href="nu.html">NU</a>  <b>B1G</b>')
     content_lines.append("")
     content_lines.append("Big Ten Standings")
-    content_lines.append("=" * 47)
+    content_lines.append(SECTION_RULE)
 
     # Header row
     content_lines.append(f'{"":>2}  {"Team":<18} {"Conf":>7} {"Overall":>7} {"Strk":>5}')
-    content_lines.append("-" * 47)
+    content_lines.append(SUBSECTION_RULE)
 
     row_idx = 0
     standings_spans = []
@@ -1581,8 +1806,7 @@ def generate_standings_html(standings: list, rankings: dict, leaders: dict = Non
         seed = entry.get("_seed", 0)
 
         # Get rank from rankings
-        rank = rankings.get(abbrev, 0)
-        rank_str = f"#{rank} " if rank else ""
+        rank_str = rank_prefix.get(abbrev, "")
         team_display = f"{rank_str}{location}"
         if len(team_display) > 18:
             team_display = team_display[:18]
@@ -1601,16 +1825,12 @@ def generate_standings_html(standings: list, rankings: dict, leaders: dict = Non
                 streak = stat.get("displayValue", "")
 
         # Build the row text
-        line_text = f"{seed:>2}  {team_display:<18} {conf_record:>7} {overall_record:>7} {streak:>5}"
+        line_text = STANDINGS_ROW % (seed, team_display, conf_record, overall_record, streak)
 
         # Highlight USC and NU rows with team colors
-        row_class = "row-even" if row_idx // 2 % 2 == 0 else "row-odd"
-        if abbrev == "USC":
-            standings_spans.append(f'<span class="{row_class}" style="color: #990000;"><b>{line_text}</b></span>')
-        elif abbrev == "NU":
-            standings_spans.append(f'<span class="{row_class}" style="color: #4E2A84;"><b>{line_text}</b></span>')
-        else:
-            standings_spans.append(f'<span class="{row_class}">{line_text}</span>')
+        row_class = ROW_CLASSES[row_idx >> 1 & 1]
+        span = TEAM_SPANS.get(abbrev, SPAN_DEFAULT)
+        standings_spans.append(span % (row_class, line_text))
         row_idx += 1
     content_lines.append("".join(standings_spans))
 
@@ -1618,9 +1838,9 @@ def generate_standings_html(standings: list, rankings: dict, leaders: dict = Non
     if leaders:
         for cat_display, entries in leaders.items():
             content_lines.append("")
-            content_lines.append("=" * 47)
+            content_lines.append(SECTION_RULE)
             content_lines.append(f'{"":>2}  {cat_display:<28} {"Value":>7}')
-            content_lines.append("-" * 47)
+            content_lines.append(SUBSECTION_RULE)
 
             leader_spans = []
             for i, entry in enumerate(entries):
@@ -1629,131 +1849,100 @@ def generate_standings_html(standings: list, rankings: dict, leaders: dict = Non
                 team = entry["team"]
                 value = entry["value"]
 
-                line_text = f"{rank:>2}  {name:<21} {team:<7} {value:>7}"
+                line_text = LEADERS_ROW % (rank, name, team, value)
 
-                row_class = "row-even" if i // 2 % 2 == 0 else "row-odd"
-                if team == "USC":
-                    leader_spans.append(f'<span class="{row_class}" style="color: #990000;"><b>{line_text}</b></span>')
-                elif team == "NU":
-                    leader_spans.append(f'<span class="{row_class}" style="color: #4E2A84;"><b>{line_text}</b></span>')
-                else:
-                    leader_spans.append(f'<span class="{row_class}">{line_text}</span>')
+                row_class = ROW_CLASSES[i >> 1 & 1]
+                span = TEAM_SPANS.get(team, SPAN_DEFAULT)
+                leader_spans.append(span % (row_class, line_text))
             content_lines.append("".join(leader_spans))
 
     content_lines.append(f"\n{VERSION}")
 
-    content = "\n".join(content_lines)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=700">
-    <title>Big Ten WBB Standings</title>
-    <meta name="data-loaded" content="{now_iso}">
-    <style>
-        * {{
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: monospace;
-            background: #ffffff;
-            color: #1a1a1a;
-            padding: 16px;
-            max-width: 100%;
-            margin: 0 auto;
-            line-height: 1.4;
-            overflow-x: auto;
-        }}
-        pre {{
-            white-space: pre;
-            min-width: 65ch;
-            margin: 0;
-            font-size: 12px;
-        }}
-        a {{
-            color: #0066cc;
-        }}
-        .row-even {{
-            background: #f0f0f0;
-            display: block;
-            margin: 0 -16px;
-            padding: 0 16px;
-        }}
-        .row-odd {{
-            background: transparent;
-            display: block;
-            margin: 0 -16px;
-            padding: 0 16px;
-        }}
-    </style>
-</head>
-<body>
-<pre>
-{content}
-</pre>
-<script>
-(function() {{
-    const dataLoaded = new Date(document.querySelector('meta[name="data-loaded"]').content);
-    const pageLoaded = new Date();
+    return render_page("Big Ten WBB Standings", now_iso, content_lines)
 
-    function formatTime(date) {{
-        return date.toLocaleTimeString('en-US', {{ hour: 'numeric', minute: '2-digit', second: '2-digit', hour12: true }});
-    }}
 
-    function timeAgo(date) {{
-        const seconds = Math.floor((new Date() - date) / 1000);
-        if (seconds < 60) return 'just now';
-        const minutes = Math.floor(seconds / 60);
-        if (minutes < 60) return minutes + ' min ago';
-        const hours = Math.floor(minutes / 60);
-        if (hours < 24) return hours + ' hr ago';
-        const days = Math.floor(hours / 24);
-        return days + ' day' + (days > 1 ? 's' : '') + ' ago';
-    }}
+# Play types that end a second chance opportunity, matched in one scan
+SECOND_CHANCE_END_RE = re.compile("Defensive Rebound|Turnover|End Period|Jumpball|Dead Ball Rebound|Steal")
 
-    function updateTimestamps() {{
-        const el = document.getElementById('timestamps');
-        if (el) {{
-            const pageLoadedStr = 'Page loaded: ' + formatTime(pageLoaded);
-            const pageAgo = '(' + timeAgo(pageLoaded) + ')';
-            const pagePadding = 65 - pageLoadedStr.length - pageAgo.length;
-            const pageSpaces = pagePadding > 0 ? ' '.repeat(pagePadding) : ' ';
 
-            const dataLoadedStr = 'Data loaded: ' + formatTime(dataLoaded);
-            const dataAgo = '(' + timeAgo(dataLoaded) + ')';
-            const dataPadding = 65 - dataLoadedStr.length - dataAgo.length;
-            const dataSpaces = dataPadding > 0 ? ' '.repeat(dataPadding) : ' ';
+# Game page additions to site.css/site.js; the dots color (team color) and
+# the period view ids/labels are filled in per page with %-formatting
+GAME_PAGE_CSS = """\
+        body {
+            line-height: 1.3;
+        }
+        .game-flow {
+            line-height: 0.5;
+            display: block;
+        }
+        .usc-dots {
+            color: #%s;
+        }
+        .dnp {
+            color: #999999;
+        }
+        .live-clock {
+            color: #cc0000;
+            font-weight: bold;
+        }
+"""
+GAME_PAGE_JS = """\
+function showPeriod(view) {
+    var views = [%s];
+    views.forEach(function(v) {
+        var ps = document.getElementById('playerstats-' + v);
+        var ts = document.getElementById('teamstats-' + v);
+        if (ps) ps.style.display = v === view ? '' : 'none';
+        if (ts) ts.style.display = v === view ? '' : 'none';
+    });
+    var toggle = document.getElementById('period-toggle');
+    if (toggle) {
+        var parts = [];
+        var labels = {%s};
+        views.forEach(function(v) {
+            if (v === view) {
+                parts.push('<b>' + labels[v] + '</b>');
+            } else {
+                parts.push('<a href="javascript:void(0)" onclick="showPeriod(\\'' + v + '\\')">' + labels[v] + '</a>');
+            }
+        });
+        toggle.innerHTML = '<b>Team Stats:</b>  ' + parts.join(' | ');
+    }
+}
+"""
 
-            el.innerHTML = pageLoadedStr + pageSpaces + pageAgo + '\\n' + dataLoadedStr + dataSpaces + dataAgo;
-        }}
-    }}
 
-    updateTimestamps();
-    setInterval(updateTimestamps, 60000); // Update every minute
-}})();
-</script>
-</body>
-</html>
-"""
-    return html
+# Box score row openers indexed by stripe parity, and the did-not-play marker
+ROW_SPAN_OPEN = tuple(f'<span class="{row_class}">' for row_class in ROW_CLASSES)
+DNP_SPAN = '<span class="dnp">  Did not play</span>'
+
+# Defaults for missing ("" or "--") box score stats, in ESPN order:
+# MIN, PTS, FG, 3PT, FT, REB, AST, TO, STL, BLK, OREB, DREB, PF
+BOX_STAT_DEFAULTS = ("0", "0", "0-0", "0-0", "0-0", "0", "0", "0", "0", "0", "0", "0", "0")
+
+# Game page player rows (after the row opener): name line with grey
+# percentages and +/-, then the counting stats. Period views have no minutes;
+# team totals use the period layout with a blank name.
+BOX_TOTALS_ROW = ('%s%-33s<span style="color:#999">%-10s%-10s%-8s%5s </span>\n'
+                  '%4s%4s%4s%4s%4s%4s%4s%4s%9s%9s%8s%6s </span>')
+BOX_PERIOD_ROW = ('%s%-33s<span style="color:#999">%-10s%-10s%-8s%5s </span>\n'
+                  '    %4s%4s%4s%4s%4s%4s%4s%9s%9s%8s%6s </span>')
 
 
 def generate_game_page(event_id: str, rankings: dict = None, team_records: dict = None,
                        team_id=USC_TEAM_ID, team_abbrev="USC", home_page="index.html", schedule_page="schedule.html",
-                       odds: dict = None) -> str:
+                       odds: dict = None, game_key: str = "", now: datetime | None = None) -> bytes:
     """Generate a detailed game report page."""
     if rankings is None:
         rankings = {}
     if team_records is None:
         team_records = {}
 
-    now = datetime.now(PT)
-    now_str = now.strftime("%I:%M:%S %p")
-    now_iso = now.isoformat()
+    if now is None:
+        now = datetime.now(PT)
+    now_str, now_iso = page_timestamps(now)
 
-    summary_url = f"{BASE_API}/summary?event={event_id}"
-    game = fetch_json(summary_url)
+    game = get_game_summary_cached(event_id)
 
     header = game.get("header", {})
     competitions = header.get("competitions", [{}])
@@ -1764,11 +1953,12 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
 
     # Get teams and scores
     competitors = comp.get("competitors", [])
-    home = next((c for c in competitors if c.get("homeAway") == "home"), {})
-    away = next((c for c in competitors if c.get("homeAway") == "away"), {})
+    home, away = split_home_away(competitors)
 
     home_team = home.get("team", {})
     away_team = away.get("team", {})
+    home_id = home_team.get("id", "")
+    away_id = away_team.get("id", "")
     home_abbrev = home_team.get("abbreviation", "HOME")
     away_abbrev = away_team.get("abbreviation", "AWAY")
     home_score = home.get("score", "0")
@@ -1800,17 +1990,14 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
     game_clock = comp.get("status", {}).get("displayClock", "")
     game_period = comp.get("status", {}).get("period", 0)
 
-    # Parse team fouls and timeouts from play-by-play
+    # Parse team fouls and timeouts from play-by-play (only shown for live games)
     home_fouls = ""
     away_fouls = ""
     home_timeouts = ""
     away_timeouts = ""
 
     plays = game.get("plays", [])
-    if plays:
-        home_id = home_team.get("id", "")
-        away_id = away_team.get("id", "")
-
+    if is_live and plays:
         # Count fouls in current quarter (fouls reset each quarter in NCAA WBB)
         home_foul_count = 0
         away_foul_count = 0
@@ -1819,19 +2006,22 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
         away_to_used = 0
 
         for p in plays:
+            # Both counts only consider plays attributed to a team
+            p_team = p.get("team")
+            play_team_id = p_team.get("id", "") if p_team else ""
+            if not play_team_id:
+                continue
             ptype = p.get("type", {}).get("text", "")
-            period = p.get("period", {}).get("number", 0)
-            play_team_id = p.get("team", {}).get("id", "") if p.get("team") else ""
 
             # Fouls in current quarter
-            if "Foul" in ptype and play_team_id and period == game_period:
+            if "Foul" in ptype and p.get("period", {}).get("number", 0) == game_period:
                 if play_team_id == home_id:
                     home_foul_count += 1
                 elif play_team_id == away_id:
                     away_foul_count += 1
 
             # Team timeouts (exclude OfficialTVTimeOut which has no team)
-            if "timeout" in ptype.lower() and play_team_id:
+            if "timeout" in ptype.lower():
                 if play_team_id == home_id:
                     home_to_used += 1
                 elif play_team_id == away_id:
@@ -1859,29 +2049,12 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
     content_lines.append("")
 
     # Determine our team and opponent - always show our team first (left side)
-    usc_is_home = home_team.get("id") == team_id
-    if usc_is_home:
-        usc_team = home_team
-        usc_score = home_score
-        usc_record = home_record
-        usc_rank = home_rank
-        usc_quarters = home_quarters
-        opp_team = away_team
-        opp_score = away_score
-        opp_record = away_record
-        opp_rank = away_rank
-        opp_quarters = away_quarters
-    else:
-        usc_team = away_team
-        usc_score = away_score
-        usc_record = away_record
-        usc_rank = away_rank
-        usc_quarters = away_quarters
-        opp_team = home_team
-        opp_score = home_score
-        opp_record = home_record
-        opp_rank = home_rank
-        opp_quarters = home_quarters
+    usc_is_home = home_id == team_id
+    home_side = (home_team, home_score, home_record, home_rank, home_quarters)
+    away_side = (away_team, away_score, away_record, away_rank, away_quarters)
+    ((usc_team, usc_score, usc_record, usc_rank, usc_quarters),
+     (opp_team, opp_score, opp_record, opp_rank, opp_quarters)) = (
+        (home_side, away_side) if usc_is_home else (away_side, home_side))
 
     # Get full team names
     usc_school = usc_team.get("location", team_abbrev)
@@ -1894,10 +2067,19 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
     usc_rank_str = f"#{usc_rank} " if usc_rank else ""
     opp_rank_str = f"#{opp_rank} " if opp_rank else ""
 
-    # Helper to center text at a position within PAGE_WIDTH
-    def center_at(text, pos):
-        start = pos - len(text) // 2
-        return " " * max(0, start) + text
+    # Helper to lay out a header line from (anchor, text, html) pieces: each
+    # piece's visible text is centered on its anchor column, at least one
+    # space after the previous piece
+    def header_line(*pieces):
+        parts = []
+        cursor = 0
+        for anchor, text, html in pieces:
+            pad = anchor - len(text) // 2 - cursor
+            pad = max(1, pad) if cursor else max(0, pad)
+            parts.append(SPACES[:pad])
+            parts.append(html)
+            cursor += pad + len(text)
+        return "".join(parts).rstrip()
 
     # Build header lines - same layout for live and final
     usc_school_full = f"{usc_rank_str}{usc_school}"
@@ -1913,63 +2095,46 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
         center_html = f"<b>{center_text}</b>"
 
     # Line 1: School names and status
-    usc_school_pad = LEFT_CENTER - len(usc_school_full) // 2
-    status_pad = PAGE_CENTER - len(center_text) // 2 - (usc_school_pad + len(usc_school_full))
-    opp_school_pad = RIGHT_CENTER - len(opp_school_full) // 2 - (usc_school_pad + len(usc_school_full) + status_pad + len(center_text))
-
-    line1 = " " * usc_school_pad + f"<b>{usc_school_full}</b>"
-    line1 += " " * max(1, status_pad) + center_html
-    line1 += " " * max(1, opp_school_pad) + f"<b>{opp_school_full}</b>"
+    content_lines.append(header_line(
+        (LEFT_CENTER, usc_school_full, f"<b>{usc_school_full}</b>"),
+        (PAGE_CENTER, center_text, center_html),
+        (RIGHT_CENTER, opp_school_full, f"<b>{opp_school_full}</b>"),
+    ))
 
     # Line 2: Team names (bold) and score
     score_str = f"{usc_score} - {opp_score}"
-    usc_name_pad = LEFT_CENTER - len(usc_name) // 2
-    score_pad = PAGE_CENTER - len(score_str) // 2 - (usc_name_pad + len(usc_name))
-    opp_name_pad = RIGHT_CENTER - len(opp_name) // 2 - (usc_name_pad + len(usc_name) + score_pad + len(score_str))
-
-    line2 = " " * usc_name_pad + f"<b>{usc_name}</b>"
-    line2 += " " * max(1, score_pad) + score_str
-    line2 += " " * max(1, opp_name_pad) + f"<b>{opp_name}</b>"
-
-    # Line 3: Records
-    usc_rec_pad = LEFT_CENTER - len(usc_record) // 2
-    opp_rec_pad = RIGHT_CENTER - len(opp_record) // 2 - (usc_rec_pad + len(usc_record))
-
-    line3 = " " * usc_rec_pad + usc_record
-    line3 += " " * max(1, opp_rec_pad) + opp_record
-
-    content_lines.append(line1.rstrip())
-    content_lines.append(line2.rstrip())
+    content_lines.append(header_line(
+        (LEFT_CENTER, usc_name, f"<b>{usc_name}</b>"),
+        (PAGE_CENTER, score_str, score_str),
+        (RIGHT_CENTER, opp_name, f"<b>{opp_name}</b>"),
+    ))
 
     # For live games, merge TF/TOL into the records and next line
     if is_live:
         if usc_is_home:
-            usc_fouls = home_fouls
-            opp_fouls = away_fouls
-            usc_timeouts = home_timeouts
-            opp_timeouts = away_timeouts
+            usc_fouls, opp_fouls, usc_timeouts, opp_timeouts = home_fouls, away_fouls, home_timeouts, away_timeouts
         else:
-            usc_fouls = away_fouls
-            opp_fouls = home_fouls
-            usc_timeouts = away_timeouts
-            opp_timeouts = home_timeouts
+            usc_fouls, opp_fouls, usc_timeouts, opp_timeouts = away_fouls, home_fouls, away_timeouts, home_timeouts
 
         # Records line with TF in the center
         fouls_str = f"{usc_fouls} TF {opp_fouls}" if usc_fouls and opp_fouls else ""
-        usc_rec_left = " " * (LEFT_CENTER - len(usc_record) // 2) + usc_record
-        fouls_pad = PAGE_CENTER - len(fouls_str) // 2 - len(usc_rec_left)
-        opp_rec_start = RIGHT_CENTER - len(opp_record) // 2
-        opp_rec_pad = opp_rec_start - (len(usc_rec_left) + max(1, fouls_pad) + len(fouls_str))
-        line3 = usc_rec_left + " " * max(1, fouls_pad) + fouls_str + " " * max(1, opp_rec_pad) + opp_record
-        content_lines.append(line3.rstrip())
+        content_lines.append(header_line(
+            (LEFT_CENTER, usc_record, usc_record),
+            (PAGE_CENTER, fouls_str, fouls_str),
+            (RIGHT_CENTER, opp_record, opp_record),
+        ))
 
         # TOL line centered
         if usc_timeouts and opp_timeouts:
             timeouts_str = f"{usc_timeouts} TOL {opp_timeouts}"
-            timeouts_padding = " " * (PAGE_CENTER - len(timeouts_str) // 2)
+            timeouts_padding = SPACES[:max(0, PAGE_CENTER - len(timeouts_str) // 2)]
             content_lines.append(f"{timeouts_padding}{timeouts_str}")
     else:
-        content_lines.append(line3.rstrip())
+        # Line 3: Records
+        content_lines.append(header_line(
+            (LEFT_CENTER, usc_record, usc_record),
+            (RIGHT_CENTER, opp_record, opp_record),
+        ))
 
     # Quarter by quarter box score - centered within 55 chars, USC first
     num_periods = max(len(usc_quarters), len(opp_quarters), 4)
@@ -1977,10 +2142,10 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
     period_labels = period_labels[:num_periods]
 
     # Build box score rows
-    box_header = "    " + "".join(f"{p:>3}" for p in period_labels) + "   T"
+    box_header = "    " + "".join([p.rjust(3) for p in period_labels]) + "   T"
     box_width = len(box_header)
     box_padding = (PAGE_WIDTH - box_width) // 2
-    pad = " " * box_padding
+    pad = SPACES[:max(0, box_padding)]
 
     content_lines.append(pad + box_header)
     content_lines.append(pad + "-" * box_width)
@@ -1988,8 +2153,8 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
     # USC first, then opponent - pad quarters to full width
     usc_q_padded = usc_quarters + [""] * (num_periods - len(usc_quarters))
     opp_q_padded = opp_quarters + [""] * (num_periods - len(opp_quarters))
-    usc_row = f"{team_abbrev:<4}" + "".join(f"{q:>3}" for q in usc_q_padded) + f" {usc_score:>3}"
-    opp_row = f"{opp_abbrev_display:<4}" + "".join(f"{q:>3}" for q in opp_q_padded) + f" {opp_score:>3}"
+    usc_row = team_abbrev.ljust(4) + "".join([q.rjust(3) for q in usc_q_padded]) + " " + usc_score.rjust(3)
+    opp_row = opp_abbrev_display.ljust(4) + "".join([q.rjust(3) for q in opp_q_padded]) + " " + opp_score.rjust(3)
     content_lines.append(pad + usc_row)
     content_lines.append(pad + opp_row)
     content_lines.append("")
@@ -2000,17 +2165,20 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
         total = odds.get("total", {})
         moneyline = odds.get("moneyline", {})
 
-        # Map full team names to abbreviations
-        name_to_abbrev = {
-            home_team.get("displayName", ""): home_abbrev,
-            away_team.get("displayName", ""): away_abbrev,
-        }
+        # Map full team names to abbreviations (only two names to compare)
+        home_dn = home_team.get("displayName", "")
+        away_dn = away_team.get("displayName", "")
+
+        def name_to_abbrev(name, default):
+            if name == away_dn:
+                return away_abbrev
+            return home_abbrev if name == home_dn else default
 
         content_lines.append("CURRENT LINE".center(PAGE_WIDTH))
 
         # Line 1: Spread and O/U
         if spread and total:
-            spread_abbrev = name_to_abbrev.get(spread.get("team", ""), home_abbrev)
+            spread_abbrev = name_to_abbrev(spread.get("team", ""), home_abbrev)
             line = spread.get("line", "")
             if line and not line.startswith("-"):
                 line = "+" + line
@@ -2021,8 +2189,8 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
 
         # Line 2: Moneyline
         if moneyline:
-            ml_home_abbrev = name_to_abbrev.get(moneyline.get("home_team", ""), home_abbrev)
-            ml_away_abbrev = name_to_abbrev.get(moneyline.get("away_team", ""), away_abbrev)
+            ml_home_abbrev = name_to_abbrev(moneyline.get("home_team", ""), home_abbrev)
+            ml_away_abbrev = name_to_abbrev(moneyline.get("away_team", ""), away_abbrev)
             home_price = moneyline.get("home", "")
             away_price = moneyline.get("away", "")
             if home_price and not home_price.startswith("-"):
@@ -2034,10 +2202,69 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
 
         content_lines.append("")
 
-    # Game Flow visualization (based on game lead)
-    plays = game.get("plays", [])
-    scoring_plays = [p for p in plays if p.get("scoringPlay")]
+    # Single pass over the play-by-play: collect scoring plays (game flow,
+    # lead stats) and calculate second chance points (team stats)
+    def scan_plays(plays, home_team_id, away_team_id):
+        """Return (scoring_plays, home_2ch, away_2ch), tracking offensive rebounds and subsequent scoring."""
+        scoring_plays = []
+        home_2ch = 0
+        away_2ch = 0
+        # Track which team is in a "second chance" state (got an offensive rebound)
+        second_chance_team = None  # "home" or "away" or None
+
+        ends_second_chance = SECOND_CHANCE_END_RE.search
+
+        for p in plays:
+            ptype = p.get("type", {}).get("text", "")
+            team = p.get("team")
+            play_team_id = team.get("id", "") if team else ""
+            score_val = p.get("scoreValue", 0)
+            is_scoring = p.get("scoringPlay", False)
+            if is_scoring:
+                scoring_plays.append(p)
+
+            # Offensive rebound: team enters second chance state
+            if "Offensive Rebound" in ptype and play_team_id:
+                if play_team_id == home_team_id:
+                    second_chance_team = "home"
+                elif play_team_id == away_team_id:
+                    second_chance_team = "away"
+                continue
+
+            # Scoring play: if team is in second chance state, count the points
+            if is_scoring and score_val and score_val > 0 and play_team_id:
+                if second_chance_team == "home" and play_team_id == home_team_id:
+                    home_2ch += score_val
+                elif second_chance_team == "away" and play_team_id == away_team_id:
+                    away_2ch += score_val
+                # Made free throws don't end second chance (could be and-1 or multiple FTs)
+                # Only end on made field goals (possession change)
+                if "FreeThrow" not in ptype:
+                    second_chance_team = None
+                continue
+
+            # A missed shot by the second-chance team doesn't end it
+            # (they could get another offensive rebound)
+            # But a missed shot by the OTHER team means they had possession,
+            # so second chance is over
+            if not is_scoring and play_team_id and "Miss" in ptype:
+                if second_chance_team == "home" and play_team_id != home_team_id:
+                    second_chance_team = None
+                elif second_chance_team == "away" and play_team_id != away_team_id:
+                    second_chance_team = None
+                continue
 
+            # Events that end the second chance opportunity
+            if ends_second_chance(ptype):
+                second_chance_team = None
+
+        return scoring_plays, home_2ch, away_2ch
+
+    scoring_plays, home_2ch_pts, away_2ch_pts = scan_plays(
+        plays, home_id, away_id
+    ) if plays else ([], 0, 0)
+
+    # Game Flow visualization (based on game lead)
     # Get opponent color for game flow
     opp_color = opp_team.get("color", "888888")
     opp_abbrev = opp_abbrev_display
@@ -2051,19 +2278,23 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
         # Dots only appear up to where the game has actually reached
         cutoff_col = total_cols  # default: show everything (completed games)
         if is_live and game_period > 0:
-            try:
-                clock_parts = game_clock.split(":")
-                mins_left = int(clock_parts[0])
-                secs_left = int(clock_parts[1]) if len(clock_parts) > 1 else 0
-                secs_elapsed = 600 - (mins_left * 60 + secs_left)
-                current_seg = min(13, max(1, int(secs_elapsed / 46) + 1)) if secs_elapsed > 0 else 0
-            except Exception:
+            secs_elapsed = clock_elapsed(game_clock)
+            if secs_elapsed is not None and secs_elapsed > 0:
+                current_seg = min(13, max(1, int(secs_elapsed / 46) + 1))
+            else:
                 current_seg = 0
             cutoff_col = (game_period - 1) * cols_per_quarter + current_seg
 
-        # Track USC lead at each column
+        # Track USC lead at each column, and lead changes, times tied and
+        # biggest leads in the same pass
         # Positive = USC leading, negative = opponent leading
         lead_at_col = {}
+        lead_changes = 0
+        times_tied = 0
+        usc_biggest_lead = 0
+        opp_biggest_lead = 0
+        last_leader = None   # last team that held a lead (ignores ties)
+        prev_leader = None   # leader after previous play (None = tied)
 
         for play in scoring_plays:
             period = play.get("period", {}).get("number", 1)
@@ -2071,21 +2302,14 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
             away_sc = play.get("awayScore", 0)
             home_sc = play.get("homeScore", 0)
 
-            # Parse clock to determine which 50-sec segment we're in (1-12)
-            try:
-                parts = clock_str.split(":")
-                minutes_left = int(parts[0])
-                seconds_left = int(parts[1]) if len(parts) > 1 else 0
-                seconds_remaining = minutes_left * 60 + seconds_left
-                seconds_elapsed = 600 - seconds_remaining  # 10-min quarters
-
-                # 13 segments of ~46 seconds each
-                if seconds_elapsed <= 0:
-                    segment = 1
-                else:
-                    segment = min(13, int(seconds_elapsed / 46) + 1)
-            except Exception:
+            # Parse clock to determine which ~46-sec segment we're in (1-13)
+            seconds_elapsed = clock_elapsed(clock_str)
+            if seconds_elapsed is None:
                 segment = 6  # default to middle
+            elif seconds_elapsed <= 0:
+                segment = 1
+            else:
+                segment = min(13, int(seconds_elapsed / 46) + 1)
 
             # Column: break at 0, segments 1-12 at cols 1-12
             col = (period - 1) * cols_per_quarter + segment
@@ -2097,6 +2321,28 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
                 lead = away_sc - home_sc
             lead_at_col[col] = lead
 
+            # Track biggest leads and the current leader
+            if lead > 0:
+                usc_biggest_lead = max(usc_biggest_lead, lead)
+                current_leader = "usc"
+            elif lead < 0:
+                opp_biggest_lead = max(opp_biggest_lead, -lead)
+                current_leader = "opp"
+            else:
+                current_leader = None
+
+            # Count lead changes (when a different team takes the lead, even through ties)
+            if current_leader is not None and last_leader is not None and current_leader != last_leader:
+                lead_changes += 1
+
+            # Count times tied (when score becomes tied after not being tied)
+            if current_leader is None and prev_leader is not None:
+                times_tied += 1
+
+            if current_leader is not None:
+                last_leader = current_leader
+            prev_leader = current_leader
+
         # Fill in gaps by carrying forward the last known lead
         # Break columns (multiples of cols_per_quarter) get None - no dots there
         # Columns past the cutoff get None (future game time, no dots yet)
@@ -2119,110 +2365,57 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
         opp_height = max(1, (max_opp_lead + 2) // 3) if max_opp_lead > 0 else 0
 
         # Build the visualization
-        # Total chart width = 7 (padding) + total_cols
-        chart_width = 7 + total_cols
+        # Total chart width = 7 (label/padding) + total_cols
+        flow_indent = "       "
+        chart_width = len(flow_indent) + total_cols
         legend = "(1 dot = 3 pts)"
         game_flow_label = "<b>Game Flow:</b>"
         # Right-justify the legend to align with the final "+"
         spacing = chart_width - 10 - len(legend)  # 10 = len("Game Flow:")
-        content_lines.append(f"{game_flow_label}{' ' * spacing}{legend}")
+        content_lines.append(f"{game_flow_label}{SPACES[:max(0, spacing)]}{legend}")
         content_lines.append("")
         content_lines.append('<span class="game-flow">')
 
+        # Dots per column for each side (a dot for every 3 points of lead),
+        # drawn as vertical strings and transposed into rows with zip()
+        usc_cols = []
+        opp_cols = []
+        for lead in filled_lead:
+            usc_dots = lead // 3 if lead is not None and lead > 0 else 0
+            opp_dots = -lead // 3 if lead is not None and lead < 0 else 0
+            usc_cols.append(" " * (usc_height - usc_dots) + "." * usc_dots)
+            opp_cols.append("." * opp_dots + " " * (opp_height - opp_dots))
+
+        # Row prefixes: team label on the row next to the timeline, else indent
+        usc_open = '<span class="usc-dots">'
+        opp_open = f'<span style="color: #{opp_color};">'
+        usc_label = f"{usc_open} {team_abbrev.ljust(6)}"
+        opp_label = f"{opp_open} {opp_abbrev.ljust(6)}"
+        usc_open += flow_indent
+        opp_open += flow_indent
+
         # USC rows (dots going up when USC is leading) - cardinal color
-        for row in range(usc_height, 0, -1):
-            threshold = row * 3
-            line = ""
-            for col in range(total_cols):
-                if filled_lead[col] is None:
-                    line += " "  # No dot at break positions
-                elif filled_lead[col] >= threshold:
-                    line += "."
-                else:
-                    line += " "
+        for row, chars in zip(range(usc_height, 0, -1), zip(*usc_cols)):
             # Put USC label on the bottom row (row 1) of USC dots
-            if row == 1:
-                content_lines.append(f'<span class="usc-dots"> {team_abbrev:<6}{line}</span>')
-            else:
-                content_lines.append(f'<span class="usc-dots">       {line}</span>')
+            content_lines.append((usc_label if row == 1 else usc_open) + "".join(chars) + "</span>")
 
         # Blank line before timeline to prevent overlap with compact line-height
         content_lines.append("")
 
         # Timeline: + at breaks, = for minutes
-        timeline = ""
-        for col in range(total_cols):
-            if col % cols_per_quarter == 0:
-                timeline += "+"
-            else:
-                timeline += "="
-        content_lines.append(f"       {timeline}")
+        timeline = ("+" + "=" * (cols_per_quarter - 1)) * num_periods + "+"
+        content_lines.append(flow_indent + timeline)
 
         # Opponent rows (dots going down when opponent is leading)
-        for row in range(1, opp_height + 1):
-            threshold = row * 3
-            line = ""
-            for col in range(total_cols):
-                if filled_lead[col] is None:
-                    line += " "  # No dot at break positions
-                elif filled_lead[col] <= -threshold:
-                    line += "."
-                else:
-                    line += " "
+        for row, chars in zip(range(1, opp_height + 1), zip(*opp_cols)):
             # Put opponent label on the first row of opponent dots
-            if row == 1:
-                content_lines.append(f'<span style="color: #{opp_color};"> {opp_abbrev:<6}{line}</span>')
-            else:
-                content_lines.append(f'<span style="color: #{opp_color};">       {line}</span>')
+            content_lines.append((opp_label if row == 1 else opp_open) + "".join(chars) + "</span>")
 
         content_lines.append('</span>')
         content_lines.append("")
 
-    # Calculate lead changes, times tied, and biggest leads from scoring plays
+    # Lead changes, times tied, and biggest leads (tallied in the game flow pass)
     if scoring_plays:
-        lead_changes = 0
-        times_tied = 0
-        usc_biggest_lead = 0
-        opp_biggest_lead = 0
-        last_leader = None   # last team that held a lead (ignores ties)
-        prev_leader = None   # leader after previous play (None = tied)
-
-        for play in scoring_plays:
-            away_sc = play.get("awayScore", 0)
-            home_sc = play.get("homeScore", 0)
-
-            # Calculate lead from USC perspective
-            if usc_is_home:
-                lead = home_sc - away_sc
-            else:
-                lead = away_sc - home_sc
-
-            # Track biggest leads
-            if lead > 0:
-                usc_biggest_lead = max(usc_biggest_lead, lead)
-            elif lead < 0:
-                opp_biggest_lead = max(opp_biggest_lead, abs(lead))
-
-            # Determine current leader
-            if lead > 0:
-                current_leader = "usc"
-            elif lead < 0:
-                current_leader = "opp"
-            else:
-                current_leader = None
-
-            # Count lead changes (when a different team takes the lead, even through ties)
-            if current_leader is not None and last_leader is not None and current_leader != last_leader:
-                lead_changes += 1
-
-            # Count times tied (when score becomes tied after not being tied)
-            if current_leader is None and prev_leader is not None:
-                times_tied += 1
-
-            if current_leader is not None:
-                last_leader = current_leader
-            prev_leader = current_leader
-
         # Display lead stats
         content_lines.append(f"<b>Lead Changes:</b> {lead_changes}")
         content_lines.append(f"<b>Times Tied:</b> {times_tied}")
@@ -2242,23 +2435,11 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
     content_lines.append("")
 
     # Calculate plus/minus from plays
-    player_plus_minus = calculate_plus_minus(plays, boxscore, home_team.get("id", "")) if plays else {}
+    player_plus_minus = calculate_plus_minus(plays, boxscore, home_id) if plays else {}
 
     # Stats header line for player stats (matches home page format)
     stats_header = " MIN ORB DRB AST STL BLK  TO FLS       FG      3PT      FT   PTS"
 
-    # Helper to parse shooting stats for totals
-    def parse_shooting(stat):
-        if not stat or stat == '--':
-            return (0, 0)
-        parts = stat.replace("/", "-").split("-")
-        if len(parts) == 2:
-            try:
-                return (int(parts[0]), int(parts[1]))
-            except Exception:
-                pass
-        return (0, 0)
-
     # Helper to get sort key for player (mins desc, pts desc, then alphabetical by last name)
     # ESPN indices: 0=MIN, 1=PTS, 2=FG, 3=3PT, 4=FT, 5=REB, 6=AST, 7=TO, 8=STL, 9=BLK, 10=OREB, 11=DREB, 12=PF
     def player_sort_key(a):
@@ -2266,77 +2447,17 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
         athlete = a.get("athlete", {})
         name = athlete.get("displayName", "Unknown")
         # Get last name for alphabetical sort
-        last_name = name.split()[-1] if name else "ZZZ"
+        last_name = name.rstrip().rpartition(" ")[2] if name else "ZZZ"
 
         if not stats or len(stats) < 6:
             return (0, 0, last_name)
         try:
-            mins = int(stats[0]) if stats[0] and stats[0] != '--' else 0
-            pts = int(stats[1]) if stats[1] and stats[1] != '--' else 0
-            return (-mins, -pts, last_name)
+            return (-parse_count(stats[0]), -parse_count(stats[1]), last_name)
         except Exception:
             return (0, 0, last_name)
 
-    # Calculate second chance points from play-by-play
-    def calculate_second_chance_pts(plays, home_team_id, away_team_id):
-        """Calculate second chance points by tracking offensive rebounds and subsequent scoring."""
-        home_2ch = 0
-        away_2ch = 0
-        # Track which team is in a "second chance" state (got an offensive rebound)
-        second_chance_team = None  # "home" or "away" or None
-
-        for p in plays:
-            ptype = p.get("type", {}).get("text", "")
-            play_team_id = p.get("team", {}).get("id", "") if p.get("team") else ""
-            score_val = p.get("scoreValue", 0)
-
-            # Offensive rebound: team enters second chance state
-            if "Offensive Rebound" in ptype and play_team_id:
-                if play_team_id == home_team_id:
-                    second_chance_team = "home"
-                elif play_team_id == away_team_id:
-                    second_chance_team = "away"
-                continue
-
-            # Scoring play: if team is in second chance state, count the points
-            is_scoring = p.get("scoringPlay", False)
-            if is_scoring and score_val and score_val > 0 and play_team_id:
-                if second_chance_team == "home" and play_team_id == home_team_id:
-                    home_2ch += score_val
-                elif second_chance_team == "away" and play_team_id == away_team_id:
-                    away_2ch += score_val
-                # Made free throws don't end second chance (could be and-1 or multiple FTs)
-                # Only end on made field goals (possession change)
-                if "FreeThrow" not in ptype:
-                    second_chance_team = None
-                continue
-
-            # A missed shot by the second-chance team doesn't end it
-            # (they could get another offensive rebound)
-            # But a missed shot by the OTHER team means they had possession,
-            # so second chance is over
-            if not is_scoring and play_team_id and "Miss" in ptype:
-                if second_chance_team == "home" and play_team_id != home_team_id:
-                    second_chance_team = None
-                elif second_chance_team == "away" and play_team_id != away_team_id:
-                    second_chance_team = None
-                continue
-
-            # Events that end the second chance opportunity
-            if any(x in ptype for x in ("Defensive Rebound", "Turnover", "End Period",
-                                         "Jumpball", "Dead Ball Rebound", "Steal")):
-                second_chance_team = None
-
-        return home_2ch, away_2ch
-
-    home_2ch_pts, away_2ch_pts = calculate_second_chance_pts(
-        plays, home_team.get("id", ""), away_team.get("id", "")
-    ) if plays else (0, 0)
-
     # Determine period views available based on play-by-play data
     has_pbp = bool(plays)
-    home_id = home_team.get("id", "")
-    away_id = away_team.get("id", "")
 
     # Build period view definitions: (view_id, label, period_numbers)
     period_views = []
@@ -2365,26 +2486,27 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
             if view_id == "total":
                 continue  # Total uses boxscore data
             period_player_stats[view_id] = compute_period_stats(plays, view_periods)
-            period_pm[view_id] = compute_period_plus_minus(plays, boxscore, home_id, view_periods)
+            period_pm[view_id] = calculate_plus_minus(plays, boxscore, home_id, view_periods)
 
     # Helper to render team stats block for a given view
     def render_team_stats(view_id, usc_ts, opp_ts, has_advanced=False):
         lines = []
-        lines.append(f"{'':>5}{'PTS':>3}  {'FG':>5} {'3PT':>5} {'FT':>5} {'OR/DR/TR':>8} {'A':>2} {'S':>2} {'B':>2}")
+        lines.append("     PTS     FG   3PT    FT OR/DR/TR  A  S  B")
         for ts in [usc_ts, opp_ts]:
             ab = ts["abbrev"]
             fg = f"{ts['fg_m']}/{ts['fg_a']}"
             thr = f"{ts['three_m']}/{ts['three_a']}"
             ft = f"{ts['ft_m']}/{ts['ft_a']}"
             reb = f"{ts['orb']}/{ts['drb']}/{ts['orb']+ts['drb']}"
-            lines.append(f"{ab:<5}{ts['pts']:>3}  {fg:>5} {thr:>5} {ft:>5} {reb:>8} {ts['ast']:>2} {ts['stl']:>2} {ts['blk']:>2}")
+            lines.append(f"{ab.ljust(5)}{str(ts['pts']).rjust(3)}  {fg.rjust(5)} {thr.rjust(5)} {ft.rjust(5)} {reb.rjust(8)} "
+                         f"{str(ts['ast']).rjust(2)} {str(ts['stl']).rjust(2)} {str(ts['blk']).rjust(2)}")
             fg_pct = f"{100*ts['fg_m']/ts['fg_a']:.1f}%" if ts['fg_a'] > 0 else "0.0%"
             thr_pct = f"{100*ts['three_m']/ts['three_a']:.1f}%" if ts['three_a'] > 0 else "0.0%"
             ft_pct = f"{100*ts['ft_m']/ts['ft_a']:.1f}%" if ts['ft_a'] > 0 else "0.0%"
-            lines.append(f"{'':>10}{fg_pct:>5} {thr_pct:>5} {ft_pct:>5}")
+            lines.append(f"          {fg_pct.rjust(5)} {thr_pct.rjust(5)} {ft_pct.rjust(5)}")
         lines.append("")
         if has_advanced and view_id == "total":
-            lines.append(f"{'':>5}{'PITP':>4}{'FB PTS':>8}{'BNCH':>6}{'OR':>4}{'2CH':>5}{'TO':>4}{'POTO':>5}{'PF':>4}")
+            lines.append("     PITP  FB PTS  BNCH  OR  2CH  TO POTO  PF")
             for ts in [usc_ts, opp_ts]:
                 ab = ts["abbrev"]
                 pitp = ts.get("pitp", "-")
@@ -2395,7 +2517,8 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
                 to_v = str(ts["to"])
                 poto = ts.get("pts_off_to", "-")
                 pf = str(ts["fls"])
-                lines.append(f"{ab:<5}{pitp:>4}{fb:>8}{bnch:>6}{orb_v:>4}{sch:>5}{to_v:>4}{poto:>5}{pf:>4}")
+                lines.append(f"{ab.ljust(5)}{pitp.rjust(4)}{fb.rjust(8)}{bnch.rjust(6)}{orb_v.rjust(4)}"
+                             f"{sch.rjust(5)}{to_v.rjust(4)}{poto.rjust(5)}{pf.rjust(4)}")
             lines.append("")
         return "\n".join(lines)
 
@@ -2427,43 +2550,51 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
             result[tid] = ts
         return result
 
+    # Per team id: sorted starters and bench, plus the team-colored section
+    # title openers (even/odd row) - the same in every view
+    team_layouts = {}
+
     # Helper to render player stats rows for a single team in a given view
-    def render_player_rows(view_id, team_data, pm_lookup, row_idx_start):
-        """Render player stat rows. Returns (list_of_span_strings, next_row_idx)."""
+    def render_player_rows(view_id, team_data, pm_lookup, stripe):
+        """Render player stat rows, drawing row parity from the shared stripe cycle."""
         spans = []
-        row_idx = row_idx_start
         team = team_data.get("team", {})
         td_abbrev = team.get("abbreviation", "TEAM")
         td_id = team.get("id", "")
 
-        if td_id == team_id:
-            tc = "990000" if team_abbrev == "USC" else "4E2A84"
-        else:
-            tc = team.get("color", "888888")
-
         statistics = team_data.get("statistics", [])
         if not statistics:
-            return spans, row_idx
+            return spans
 
-        athletes = statistics[0].get("athletes", [])
-        starters = [a for a in athletes if a.get("starter")]
-        bench = [a for a in athletes if not a.get("starter")]
-        starters_sorted = sorted(starters, key=player_sort_key)
-        bench_sorted = sorted(bench, key=player_sort_key)
+        layout = team_layouts.get(td_id)
+        if layout is None:
+            if td_id == team_id:
+                tc = "990000" if team_abbrev == "USC" else "4E2A84"
+            else:
+                tc = team.get("color", "888888")
+            athletes = statistics[0].get("athletes", [])
+            starters = [a for a in athletes if a.get("starter")]
+            bench = [a for a in athletes if not a.get("starter")]
+            titles = {
+                section: tuple(f'<span class="{row_class}" style="color: #{tc};"><b>{td_abbrev} {section}</b>\n'
+                               for row_class in ROW_CLASSES)
+                for section in ("STARTERS", "BENCH", "TOTALS")
+            }
+            layout = team_layouts[td_id] = (sorted(starters, key=player_sort_key),
+                                            sorted(bench, key=player_sort_key), titles)
+        starters_sorted, bench_sorted, titles = layout
 
         period_header = " MIN ORB DRB AST STL BLK  TO FLS       FG      3PT      FT   PTS" if view_id == "total" else "     ORB DRB AST STL BLK  TO FLS       FG      3PT      FT   PTS"
 
-        team_totals = {"fg_made": 0, "fg_att": 0, "three_made": 0, "three_att": 0,
-                       "ft_made": 0, "ft_att": 0, "pts": 0, "orb": 0, "drb": 0,
-                       "ast": 0, "stl": 0, "blk": 0, "to": 0, "fls": 0}
+        # Positional totals: fg_m, fg_a, three_m, three_a, ft_m, ft_a, pts,
+        # orb, drb, ast, stl, blk, to, fls
+        team_totals = [0] * 14
         total_pm = 0
 
         pstats = period_player_stats.get(view_id, {}) if view_id != "total" else {}
 
         for section_name, section_athletes in [("STARTERS", starters_sorted), ("BENCH", bench_sorted)]:
-            row_class = "row-even" if row_idx % 2 == 0 else "row-odd"
-            spans.append(f'<span class="{row_class}" style="color: #{tc};"><b>{td_abbrev} {section_name}</b>\n{period_header}</span>')
-            row_idx += 1
+            spans.append(f'{titles[section_name][next(stripe)]}{period_header}</span>')
 
             for a in section_athletes:
                 athlete = a.get("athlete", {})
@@ -2472,68 +2603,46 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
                 jersey = athlete.get("jersey", "")
                 stats = a.get("stats", [])
 
-                row_class = "row-even" if row_idx % 2 == 0 else "row-odd"
-                row_idx += 1
-
                 jersey_str = f"#{jersey}" if jersey else ""
                 name_part = f"{name} {jersey_str}"
 
                 if view_id == "total":
                     # Use boxscore stats directly
+                    row_open = ROW_SPAN_OPEN[next(stripe)]
                     if not stats or len(stats) < 13:
-                        spans.append(f'<span class="{row_class}">{name_part}\n<span class="dnp">  Did not play</span></span>')
+                        spans.append(f'{row_open}{name_part}\n{DNP_SPAN}</span>')
                         continue
-                    mins = stats[0] if stats[0] and stats[0] != '--' else "0"
-                    pts = stats[1] if stats[1] and stats[1] != '--' else "0"
-                    fg = stats[2] if stats[2] and stats[2] != '--' else "0-0"
-                    threept = stats[3] if stats[3] and stats[3] != '--' else "0-0"
-                    ft = stats[4] if stats[4] and stats[4] != '--' else "0-0"
-                    orb = stats[10] if stats[10] and stats[10] != '--' else "0"
-                    drb = stats[11] if stats[11] and stats[11] != '--' else "0"
-                    ast = stats[6] if stats[6] and stats[6] != '--' else "0"
-                    stl = stats[8] if stats[8] and stats[8] != '--' else "0"
-                    blk = stats[9] if stats[9] and stats[9] != '--' else "0"
-                    to = stats[7] if stats[7] and stats[7] != '--' else "0"
-                    fls = stats[12] if stats[12] and stats[12] != '--' else "0"
+                    (mins, pts, fg, threept, ft, _, ast, to, stl, blk, orb, drb, fls) = [
+                        v if v and v != '--' else d for v, d in zip(stats, BOX_STAT_DEFAULTS)]
 
                     if mins == "0" or mins == "0:00":
-                        spans.append(f'<span class="{row_class}">{name_part}\n<span class="dnp">  Did not play</span></span>')
+                        spans.append(f'{row_open}{name_part}\n{DNP_SPAN}</span>')
                         continue
 
                     fg_m, fg_a = parse_shooting(fg)
                     three_m, three_a = parse_shooting(threept)
                     ft_m, ft_a = parse_shooting(ft)
-                    team_totals["fg_made"] += fg_m; team_totals["fg_att"] += fg_a
-                    team_totals["three_made"] += three_m; team_totals["three_att"] += three_a
-                    team_totals["ft_made"] += ft_m; team_totals["ft_att"] += ft_a
-                    team_totals["pts"] += int(pts) if pts else 0
-                    team_totals["orb"] += int(orb) if orb else 0
-                    team_totals["drb"] += int(drb) if drb else 0
-                    team_totals["ast"] += int(ast) if ast else 0
-                    team_totals["stl"] += int(stl) if stl else 0
-                    team_totals["blk"] += int(blk) if blk else 0
-                    team_totals["to"] += int(to) if to else 0
-                    team_totals["fls"] += int(fls) if fls else 0
-
-                    fg_pct = f"{f'{100 * fg_m / fg_a:.2f}%':>8}" if fg_a > 0 else "      --"
-                    three_pct = f"{f'{100 * three_m / three_a:.2f}%':>8}" if three_a > 0 else "      --"
-                    ft_pct = f"{f'{100 * ft_m / ft_a:.2f}%':>7}" if ft_a > 0 else "     --"
+                    team_totals[:] = map(add, team_totals, (
+                        fg_m, fg_a, three_m, three_a, ft_m, ft_a, int(pts),
+                        int(orb), int(drb), int(ast), int(stl), int(blk), int(to), int(fls)))
+
+                    fg_pct = pct_cell(fg_m, fg_a, 8)
+                    three_pct = pct_cell(three_m, three_a, 8)
+                    ft_pct = pct_cell(ft_m, ft_a, 7)
                     pm_val = pm_lookup.get(athlete_id, 0)
                     total_pm += pm_val
                     pm_str = f"+{pm_val}" if pm_val > 0 else str(pm_val)
-                    grey_part = f"{fg_pct:<10}{three_pct:<10}{ft_pct:<8}{pm_str:>5} "
-                    player_line = f'{name_part:<33}<span style="color:#999">{grey_part}</span>'
-                    fg_str = f"{fg_m}/{fg_a}"
-                    three_str = f"{three_m}/{three_a}"
-                    ft_str = f"{ft_m}/{ft_a}"
-                    stats_line = f"{mins:>4}{orb:>4}{drb:>4}{ast:>4}{stl:>4}{blk:>4}{to:>4}{fls:>4}{fg_str:>9}{three_str:>9}{ft_str:>8}{pts:>6} "
+                    spans.append(BOX_TOTALS_ROW % (
+                        row_open, name_part, fg_pct, three_pct, ft_pct, pm_str,
+                        mins, orb, drb, ast, stl, blk, to, fls,
+                        f"{fg_m}/{fg_a}", f"{three_m}/{three_a}", f"{ft_m}/{ft_a}", pts))
                 else:
                     # Period view - use computed stats
                     ps = pstats.get(athlete_id)
                     if not ps or all(ps[k] == 0 for k in ("pts", "fg_a", "ft_a", "orb", "drb", "ast", "stl", "blk", "to", "fls")):
                         # Skip players with zero stats in this period
-                        row_idx -= 1  # undo the row_idx increment
                         continue
+                    row_open = ROW_SPAN_OPEN[next(stripe)]
 
                     fg_m = ps["fg_m"]; fg_a = ps["fg_a"]
                     three_m = ps["three_m"]; three_a = ps["three_a"]
@@ -2542,56 +2651,37 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
                     ast_v = ps["ast"]; stl_v = ps["stl"]; blk_v = ps["blk"]
                     to_v = ps["to"]; fls_v = ps["fls"]
 
-                    team_totals["fg_made"] += fg_m; team_totals["fg_att"] += fg_a
-                    team_totals["three_made"] += three_m; team_totals["three_att"] += three_a
-                    team_totals["ft_made"] += ft_m; team_totals["ft_att"] += ft_a
-                    team_totals["pts"] += pts_v; team_totals["orb"] += orb_v
-                    team_totals["drb"] += drb_v; team_totals["ast"] += ast_v
-                    team_totals["stl"] += stl_v; team_totals["blk"] += blk_v
-                    team_totals["to"] += to_v; team_totals["fls"] += fls_v
-
-                    fg_pct = f"{f'{100 * fg_m / fg_a:.2f}%':>8}" if fg_a > 0 else "      --"
-                    three_pct = f"{f'{100 * three_m / three_a:.2f}%':>8}" if three_a > 0 else "      --"
-                    ft_pct = f"{f'{100 * ft_m / ft_a:.2f}%':>7}" if ft_a > 0 else "     --"
+                    team_totals[:] = map(add, team_totals, (
+                        fg_m, fg_a, three_m, three_a, ft_m, ft_a, pts_v,
+                        orb_v, drb_v, ast_v, stl_v, blk_v, to_v, fls_v))
+
+                    fg_pct = pct_cell(fg_m, fg_a, 8)
+                    three_pct = pct_cell(three_m, three_a, 8)
+                    ft_pct = pct_cell(ft_m, ft_a, 7)
                     pm_val = pm_lookup.get(athlete_id, 0)
                     total_pm += pm_val
                     pm_str = f"+{pm_val}" if pm_val > 0 else str(pm_val)
-                    grey_part = f"{fg_pct:<10}{three_pct:<10}{ft_pct:<8}{pm_str:>5} "
-                    player_line = f'{name_part:<33}<span style="color:#999">{grey_part}</span>'
-                    fg_str = f"{fg_m}/{fg_a}"
-                    three_str = f"{three_m}/{three_a}"
-                    ft_str = f"{ft_m}/{ft_a}"
-                    stats_line = f"    {orb_v:>4}{drb_v:>4}{ast_v:>4}{stl_v:>4}{blk_v:>4}{to_v:>4}{fls_v:>4}{fg_str:>9}{three_str:>9}{ft_str:>8}{pts_v:>6} "
-
-                spans.append(f'<span class="{row_class}">{player_line}\n{stats_line}</span>')
+                    spans.append(BOX_PERIOD_ROW % (
+                        row_open, name_part, fg_pct, three_pct, ft_pct, pm_str,
+                        orb_v, drb_v, ast_v, stl_v, blk_v, to_v, fls_v,
+                        f"{fg_m}/{fg_a}", f"{three_m}/{three_a}", f"{ft_m}/{ft_a}", pts_v))
 
         # Totals row
-        row_class = "row-even" if row_idx % 2 == 0 else "row-odd"
-        spans.append(f'<span class="{row_class}" style="color: #{tc};"><b>{td_abbrev} TOTALS</b>\n{period_header}</span>')
-        row_idx += 1
+        spans.append(f'{titles["TOTALS"][next(stripe)]}{period_header}</span>')
 
-        fg_total = f"{team_totals['fg_made']}/{team_totals['fg_att']}"
-        three_total = f"{team_totals['three_made']}/{team_totals['three_att']}"
-        ft_total = f"{team_totals['ft_made']}/{team_totals['ft_att']}"
-        fg_pct_val = f"{100 * team_totals['fg_made'] / team_totals['fg_att']:.2f}%" if team_totals['fg_att'] > 0 else "--"
-        three_pct_val = f"{100 * team_totals['three_made'] / team_totals['three_att']:.2f}%" if team_totals['three_att'] > 0 else "--"
-        ft_pct_val = f"{100 * team_totals['ft_made'] / team_totals['ft_att']:.2f}%" if team_totals['ft_att'] > 0 else "--"
-        fg_pct = f"{fg_pct_val:>8}"
-        three_pct = f"{three_pct_val:>8}"
-        ft_pct = f"{ft_pct_val:>7}"
+        fg_m, fg_a, three_m, three_a, ft_m, ft_a, pts, orb, drb, ast, stl, blk, to, fls = team_totals
+        fg_pct = pct_cell(fg_m, fg_a, 8)
+        three_pct = pct_cell(three_m, three_a, 8)
+        ft_pct = pct_cell(ft_m, ft_a, 7)
         pm_str = f"+{total_pm}" if total_pm > 0 else str(total_pm)
 
-        pct_line = f"{'':33}<span style=\"color:#999\">{fg_pct:<10}{three_pct:<10}{ft_pct:<8}{pm_str:>5} </span>"
-        if view_id == "total":
-            totals_line = f"    {team_totals['orb']:>4}{team_totals['drb']:>4}{team_totals['ast']:>4}{team_totals['stl']:>4}{team_totals['blk']:>4}{team_totals['to']:>4}{team_totals['fls']:>4}{fg_total:>9}{three_total:>9}{ft_total:>8}{team_totals['pts']:>6} "
-        else:
-            totals_line = f"    {team_totals['orb']:>4}{team_totals['drb']:>4}{team_totals['ast']:>4}{team_totals['stl']:>4}{team_totals['blk']:>4}{team_totals['to']:>4}{team_totals['fls']:>4}{fg_total:>9}{three_total:>9}{ft_total:>8}{team_totals['pts']:>6} "
-
-        row_class = "row-even" if row_idx % 2 == 0 else "row-odd"
-        spans.append(f'<span class="{row_class}">{pct_line}\n{totals_line}</span>')
-        row_idx += 1
+        # Same layout as a period view player row, with no name and no minutes
+        spans.append(BOX_PERIOD_ROW % (
+            ROW_SPAN_OPEN[next(stripe)], "", fg_pct, three_pct, ft_pct, pm_str,
+            orb, drb, ast, stl, blk, to, fls,
+            f"{fg_m}/{fg_a}", f"{three_m}/{three_a}", f"{ft_m}/{ft_a}", pts))
 
-        return spans, row_idx
+        return spans
 
     # Team Stats section
     team_players = boxscore.get("players", [])
@@ -2612,21 +2702,17 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
                     mins = st[0] if st[0] and st[0] != '--' else "0"
                     if mins == "0" or mins == "0:00":
                         continue
-                    fm, fa = parse_shooting(st[2] if st[2] and st[2] != '--' else "0-0")
-                    tm, ta = parse_shooting(st[3] if st[3] and st[3] != '--' else "0-0")
-                    ftm, fta = parse_shooting(st[4] if st[4] and st[4] != '--' else "0-0")
-                    p = int(st[1]) if st[1] and st[1] != '--' else 0
+                    fm, fa = parse_shooting(st[2])
+                    tm, ta = parse_shooting(st[3])
+                    ftm, fta = parse_shooting(st[4])
+                    p, orb, drb, ast, stl, blk, to, fls = [parse_count(st[i]) for i in (1, 10, 11, 6, 8, 9, 7, 12)]
                     ts["fg_m"] += fm; ts["fg_a"] += fa
                     ts["three_m"] += tm; ts["three_a"] += ta
                     ts["ft_m"] += ftm; ts["ft_a"] += fta
-                    ts["pts"] += p
-                    ts["orb"] += int(st[10]) if st[10] and st[10] != '--' else 0
-                    ts["drb"] += int(st[11]) if st[11] and st[11] != '--' else 0
-                    ts["ast"] += int(st[6]) if st[6] and st[6] != '--' else 0
-                    ts["stl"] += int(st[8]) if st[8] and st[8] != '--' else 0
-                    ts["blk"] += int(st[9]) if st[9] and st[9] != '--' else 0
-                    ts["to"] += int(st[7]) if st[7] and st[7] != '--' else 0
-                    ts["fls"] += int(st[12]) if st[12] and st[12] != '--' else 0
+                    ts["pts"] += p; ts["orb"] += orb
+                    ts["drb"] += drb; ts["ast"] += ast
+                    ts["stl"] += stl; ts["blk"] += blk
+                    ts["to"] += to; ts["fls"] += fls
                     if not a.get("starter"):
                         ts["bench_pts"] += p
             pre_stats[tid] = ts
@@ -2651,7 +2737,7 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
         if away_id in pre_stats:
             pre_stats[away_id]["second_ch"] = str(away_2ch_pts)
 
-        usc_tid = next((t for t in pre_stats if t == team_id), None)
+        usc_tid = team_id if team_id in pre_stats else None
         opp_tid = next((t for t in pre_stats if t != team_id), None)
 
         if usc_tid and opp_tid:
@@ -2698,15 +2784,12 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
         for view_id, _, _ in period_views:
             pm_lookup = player_plus_minus if view_id == "total" else period_pm.get(view_id, {})
             all_spans = []
-            row_idx = 0
+            stripe = cycle((0, 1))
             for team_data in players_data_sorted:
                 td_id = team_data.get("team", {}).get("id", "")
-                spans, row_idx = render_player_rows(view_id, team_data, pm_lookup, row_idx)
-                all_spans.extend(spans)
+                all_spans.extend(render_player_rows(view_id, team_data, pm_lookup, stripe))
                 if td_id == team_id:
-                    row_class = "row-even" if row_idx % 2 == 0 else "row-odd"
-                    all_spans.append(f'<span class="{row_class}">\n\n</span>')
-                    row_idx += 1
+                    all_spans.append(ROW_SPAN_OPEN[next(stripe)] + "\n\n</span>")
 
             display = '' if view_id == 'total' else 'display:none'
             style_attr = f' style="{display}"' if display else ''
@@ -2714,15 +2797,12 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
     else:
         # No period views - render total only (original behavior)
         all_spans = []
-        row_idx = 0
+        stripe = cycle((0, 1))
         for team_data in players_data_sorted:
             td_id = team_data.get("team", {}).get("id", "")
-            spans, row_idx = render_player_rows("total", team_data, player_plus_minus, row_idx)
-            all_spans.extend(spans)
+            all_spans.extend(render_player_rows("total", team_data, player_plus_minus, stripe))
             if td_id == team_id:
-                row_class = "row-even" if row_idx % 2 == 0 else "row-odd"
-                all_spans.append(f'<span class="{row_class}">\n\n</span>')
-                row_idx += 1
+                all_spans.append(ROW_SPAN_OPEN[next(stripe)] + "\n\n</span>")
         content_lines.append("".join(all_spans))
 
     content_lines.append("")
@@ -2730,8 +2810,6 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
     # No bottom links - navigation is at top
     content_lines.append(VERSION)
 
-    content = "\n".join(content_lines)
-
     # Build JS data for period toggle
     if has_pbp and period_views:
         period_views_js = ",".join(f"'{v[0]}'" for v in period_views)
@@ -2740,420 +2818,279 @@ def generate_game_page(event_id: str, rankings: dict = None, team_records: dict
         period_views_js = "'total'"
         period_labels_js = "'total':'Total'"
 
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=700">
-    <title>{away_abbrev} vs {home_abbrev} - {team_abbrev} WBB</title>
-    <meta name="data-loaded" content="{now_iso}">
-    <style>
-        * {{
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: monospace;
-            background: #ffffff;
-            color: #1a1a1a;
-            padding: 16px;
-            max-width: 100%;
-            margin: 0 auto;
-            line-height: 1.3;
-            overflow-x: auto;
-        }}
-        pre {{
-            white-space: pre;
-            min-width: 65ch;
-            margin: 0;
-            font-size: 12px;
-        }}
-        a {{
-            color: #0066cc;
-        }}
-        .row-even {{
-            background: #f0f0f0;
-            display: block;
-            margin: 0 -16px;
-            padding: 0 16px;
-        }}
-        .row-odd {{
-            background: transparent;
-            display: block;
-            margin: 0 -16px;
-            padding: 0 16px;
-        }}
-        .game-flow {{
-            line-height: 0.5;
-            display: block;
-        }}
-        .usc-dots {{
-            color: #{"990000" if team_abbrev == "USC" else "4E2A84"};
-        }}
-        .dnp {{
-            color: #999999;
-        }}
-        .live-clock {{
-            color: #cc0000;
-            font-weight: bold;
-        }}
-    </style>
-</head>
-<body>
-<pre>
-{content}
-</pre>
-<script>
-(function() {{
-    const dataLoaded = new Date(document.querySelector('meta[name="data-loaded"]').content);
-    const pageLoaded = new Date();
-
-    function formatTime(date) {{
-        return date.toLocaleTimeString('en-US', {{ hour: 'numeric', minute: '2-digit', second: '2-digit', hour12: true }});
-    }}
-
-    function timeAgo(date) {{
-        const seconds = Math.floor((new Date() - date) / 1000);
-        if (seconds < 60) return 'just now';
-        const minutes = Math.floor(seconds / 60);
-        if (minutes < 60) return minutes + ' min ago';
-        const hours = Math.floor(minutes / 60);
-        if (hours < 24) return hours + ' hr ago';
-        const days = Math.floor(hours / 24);
-        return days + ' day' + (days > 1 ? 's' : '') + ' ago';
-    }}
-
-    function updateTimestamps() {{
-        const el = document.getElementById('timestamps');
-        if (el) {{
-            const pageLoadedStr = 'Page loaded: ' + formatTime(pageLoaded);
-            const pageAgo = '(' + timeAgo(pageLoaded) + ')';
-            const pagePadding = 65 - pageLoadedStr.length - pageAgo.length;
-            const pageSpaces = pagePadding > 0 ? ' '.repeat(pagePadding) : ' ';
-
-            const dataLoadedStr = 'Data loaded: ' + formatTime(dataLoaded);
-            const dataAgo = '(' + timeAgo(dataLoaded) + ')';
-            const dataPadding = 65 - dataLoadedStr.length - dataAgo.length;
-            const dataSpaces = dataPadding > 0 ? ' '.repeat(dataPadding) : ' ';
-
-            el.innerHTML = pageLoadedStr + pageSpaces + pageAgo + '\\n' + dataLoadedStr + dataSpaces + dataAgo;
-        }}
-    }}
-
-    updateTimestamps();
-    setInterval(updateTimestamps, 60000); // Update every minute
-}})();
-function showPeriod(view) {{
-    var views = [{period_views_js}];
-    views.forEach(function(v) {{
-        var ps = document.getElementById('playerstats-' + v);
-        var ts = document.getElementById('teamstats-' + v);
-        if (ps) ps.style.display = v === view ? '' : 'none';
-        if (ts) ts.style.display = v === view ? '' : 'none';
-    }});
-    var toggle = document.getElementById('period-toggle');
-    if (toggle) {{
-        var parts = [];
-        var labels = {{{period_labels_js}}};
-        views.forEach(function(v) {{
-            if (v === view) {{
-                parts.push('<b>' + labels[v] + '</b>');
-            }} else {{
-                parts.push('<a href="javascript:void(0)" onclick="showPeriod(\\'' + v + '\\')">' + labels[v] + '</a>');
-            }}
-        }});
-        toggle.innerHTML = '<b>Team Stats:</b>  ' + parts.join(' | ');
-    }}
-}}
-</script>
-</body>
-</html>
-"""
-    return html
-
+    dots_color = "990000" if team_abbrev == "USC" else "4E2A84"
+    game_css = GAME_PAGE_CSS % dots_color
+    game_js = GAME_PAGE_JS % (period_views_js, period_labels_js)
+    return render_page(f"{away_abbrev} vs {home_abbrev} - {team_abbrev} WBB", now_iso, content_lines,
+                       game_css, game_js, asset_prefix="../", game_key=game_key)
 
-def main():
-    force_update = "--force" in sys.argv
-
-    print("Fetching Women's Basketball data...")
-
-    # Get schedules and scoreboard (lightweight calls)
-    schedule = get_team_schedule()
-    nu_schedule = get_team_schedule(team_id=NU_TEAM_ID)
-    scoreboard = get_scoreboard()
-
-    # Check if we should update (either team live/imminent triggers update)
-    usc_should, usc_reason = is_game_live_or_imminent(schedule, scoreboard)
-    nu_should, nu_reason = is_game_live_or_imminent(nu_schedule, scoreboard, team_id=NU_TEAM_ID)
-    should_update = usc_should or nu_should
-    reason = usc_reason if usc_should else nu_reason
-
-    if not should_update and not force_update:
-        print(f"Skipping update: {reason}")
-        print("Use --force to update anyway")
-        sys.exit(1)  # Non-zero exit tells workflow to skip commit
 
-    print(f"Updating: {reason}" if should_update else "Forced update")
+# Stamped into final game pages by render_page; only the start of a page is read back
+GAME_KEY_RE = re.compile(rb'<meta name="game-key" content="([0-9a-f]+)">')
 
-    # Fetch rankings
-    rankings = get_rankings()
-    now_utc = datetime.now(timezone.utc)
+# Identifies the page generator. VERSION can't be used: it names the latest
+# commit, and CI commits refreshed pages on every run.
+GENERATOR_HASH = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
 
-    # Find live/recent games for both teams (needed for cross-team display on homepages)
-    usc_game = find_usc_game(scoreboard, schedule)
-    nu_game = find_usc_game(scoreboard, nu_schedule, team_id=NU_TEAM_ID)
 
-    # --- USC pages ---
-    print("Generating USC pages...")
+def game_page_key(event: dict, odds: dict | None, rankings: dict = None, team_records: dict = None,
+                  now: datetime | None = None, **page_kwargs) -> str | None:
+    """Hash of everything a final game's page depends on, or None if the game isn't final.
 
-    print("Fetching USC player stats...")
-    roster = get_roster_with_stats()
+    A final game's summary never changes, so its page only needs rebuilding when
+    the teams' current ranks or records, its odds, the page links or this
+    script (GENERATOR_HASH) change. The page timestamp (now) and VERSION are not
+    part of the key, so a skipped page keeps the "Data loaded" time and version
+    footer of the run that last wrote it, i.e. when its content last changed.
+    """
+    if get_event_state(event) != "post":
+        return None
+    comp = event["competitions"][0]
+    rankings = rankings or {}
+    team_records = team_records or {}
+    teams = []
+    for c in comp.get("competitors", []):
+        abbrev = c.get("team", {}).get("abbreviation", "")
+        teams.append((abbrev, c.get("score"), rankings.get(abbrev, 0), team_records.get(abbrev, "")))
+    key = repr((GENERATOR_HASH, event.get("id"), teams, odds, sorted(page_kwargs.items())))
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def read_game_key(path: Path) -> str | None:
+    """Return the game key stamped in an existing page, or None."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(1024)
+    except OSError:
+        return None
+    m = GAME_KEY_RE.search(head)
+    return m.group(1).decode() if m else None
 
-    # Fetch prior season rosters (cached for completed seasons)
-    usc_prior_rosters = {}
-    for year in [2025, 2024]:
-        print(f"Fetching USC {year-1}-{str(year)[2:]} roster stats (cached)...")
-        usc_prior_rosters[year] = get_roster_with_stats_cached(USC_TEAM_ID, year)
 
-    # Generate HTML
-    html = generate_game_html(usc_game, schedule, rankings, roster,
-        other_game_data=nu_game, other_schedule=nu_schedule,
-        other_team_id=NU_TEAM_ID, other_team_abbrev="NU", other_games_dir="nu-games",
-        prior_rosters=usc_prior_rosters)
-
-    # Write output
-    output_path = Path(__file__).parent.parent / "index.html"
-    output_path.write_text(html)
-    print(f"Written to {output_path}")
+def write_game_pages(events: list, games_dir: Path, label: str = "game",
+                     odds_map: dict | None = None, rebuild: bool = False, **page_kwargs):
+    """Generate and write a game page for each event, several at a time.
 
-    # Generate schedule pages for current and prior seasons
-    schedule_html = generate_schedule_html(schedule, rankings, season_year=2026, schedule_page_base="schedule")
-    schedule_path = Path(__file__).parent.parent / "schedule.html"
-    schedule_path.write_text(schedule_html)
-    print(f"Written to {schedule_path}")
+    Building a page is dominated by fetching its game summary, so pages are
+    generated on a thread pool. page_kwargs are passed to generate_game_page;
+    odds_map supplies per-event odds. Final games whose existing page carries
+    the same game_page_key are left alone unless rebuild is set. Errors are
+    reported per game, in order.
+    """
+    unchanged = []
 
-    # Store prior schedules for reuse when generating game pages
-    usc_prior_schedules = {}
-    for prior_year in [2025, 2024]:
-        print(f"Fetching USC {prior_year-1}-{str(prior_year)[2:]} schedule...")
-        prior_schedule = get_team_schedule(season=prior_year)
-        usc_prior_schedules[prior_year] = prior_schedule
-        prior_html = generate_schedule_html(prior_schedule, rankings,
-            season_year=prior_year, schedule_page_base="schedule")
-        prior_path = Path(__file__).parent.parent / f"schedule-{prior_year}.html"
-        prior_path.write_text(prior_html)
-        print(f"Written to {prior_path}")
+    def write_page(event):
+        event_id = event.get("id", "")
+        path = games_dir / f"{event_id}.html"
+        try:
+            odds = odds_map.get(event_id) if odds_map else None
+            game_key = game_page_key(event, odds, **page_kwargs)
+            if game_key and not rebuild and read_game_key(path) == game_key:
+                unchanged.append(event_id)
+                return None
+            game_html = generate_game_page(event_id, odds=odds, game_key=game_key or "", **page_kwargs)
+            path.write_bytes(game_html)
+        except Exception as e:
+            return f"  Error generating {label} {event_id}: {e}"
+        return None
 
-    # Generate individual game pages for completed games
-    usc_games_dir = Path(__file__).parent.parent / "games"
-    usc_games_dir.mkdir(exist_ok=True)
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        for error in executor.map(write_page, [e for e in events if e.get("id", "")]):
+            if error:
+                print(error)
+    if unchanged:
+        print(f"  {len(unchanged)} unchanged final {label} pages left as is")
 
-    events = schedule.get("events", [])
-    completed = [e for e in events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") == "post"]
-    live = [e for e in events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") not in ("pre", "post", "")]
 
-    # Get current team records from schedule
-    # Iterate all completed games so each team's record reflects their latest appearance
+def collect_team_records(events: list) -> dict:
+    """Map team abbreviation to overall record, from each team's latest completed game."""
     team_records = {}
-    for event in completed:
+    for event in events:
         for competitor in event.get("competitions", [{}])[0].get("competitors", []):
             abbrev = competitor.get("team", {}).get("abbreviation", "")
-            records = competitor.get("records", [])
-            for rec in records:
+            for rec in competitor.get("records", []):
                 if rec.get("type") == "total":
                     team_records[abbrev] = rec.get("summary", "")
                     break
+    return team_records
+
 
-    # Fetch odds for imminent/live USC games
-    usc_odds_map = {}
-    imminent_pre = [e for e in events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") == "pre"]
-    for event in imminent_pre + live:
+def fetch_odds_map(events: list, now_utc: datetime) -> dict:
+    """Fetch odds for events starting within PREGAME_WINDOW_MINUTES (or live), keyed by event id."""
+    odds_map = {}
+    for event in events:
         comp = event.get("competitions", [{}])[0]
         date_str = comp.get("date", "")
         if date_str:
             try:
-                game_time = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                game_time = parse_iso(date_str)
                 if (game_time - now_utc).total_seconds() / 60 <= PREGAME_WINDOW_MINUTES:
                     eid = event.get("id", "")
                     competitors = comp.get("competitors", [])
-                    home_c = next((c for c in competitors if c.get("homeAway") == "home"), {})
-                    away_c = next((c for c in competitors if c.get("homeAway") == "away"), {})
+                    home_c, away_c = split_home_away(competitors)
                     home_name = home_c.get("team", {}).get("displayName", "")
                     away_name = away_c.get("team", {}).get("displayName", "")
                     if eid and home_name and away_name:
                         odds = fetch_game_odds(eid, home_name, away_name)
                         if odds:
-                            usc_odds_map[eid] = odds
+                            odds_map[eid] = odds
             except Exception:
                 pass
+    return odds_map
 
-    games_to_generate = completed + live
-    print(f"Generating {len(games_to_generate)} USC game pages...")
-    for event in games_to_generate:
-        event_id = event.get("id", "")
-        if event_id:
-            try:
-                game_html = generate_game_page(event_id, rankings, team_records,
-                    odds=usc_odds_map.get(event_id))
-                game_path = usc_games_dir / f"{event_id}.html"
-                game_path.write_text(game_html)
-            except Exception as e:
-                print(f"  Error generating game {event_id}: {e}")
-    print(f"Written USC game pages to {usc_games_dir}")
-
-    # Generate game pages for prior USC seasons
-    for prior_year in [2025, 2024]:
-        prior_schedule = usc_prior_schedules[prior_year]
-        prior_events = prior_schedule.get("events", [])
-        prior_completed = [e for e in prior_events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") == "post"]
-
-        prior_team_records = {}
-        for event in prior_completed:
-            for competitor in event.get("competitions", [{}])[0].get("competitors", []):
-                abbrev = competitor.get("team", {}).get("abbreviation", "")
-                records = competitor.get("records", [])
-                for rec in records:
-                    if rec.get("type") == "total":
-                        prior_team_records[abbrev] = rec.get("summary", "")
-                        break
-
-        prior_schedule_page = f"schedule-{prior_year}.html"
-        print(f"Generating {len(prior_completed)} USC {prior_year-1}-{str(prior_year)[2:]} game pages...")
-        for event in prior_completed:
-            event_id = event.get("id", "")
-            if event_id:
-                try:
-                    game_html = generate_game_page(event_id, {}, prior_team_records,
-                        schedule_page=prior_schedule_page)
-                    game_path = usc_games_dir / f"{event_id}.html"
-                    game_path.write_text(game_html)
-                except Exception as e:
-                    print(f"  Error generating game {event_id}: {e}")
 
-    # --- NU pages ---
-    print("Generating NU pages...")
+def generate_team_pages(site_dir: Path, schedule: dict, game: dict | None, rankings: dict, now_utc: datetime,
+                        other_game, other_schedule, other_team_id, other_team_abbrev, other_games_dir,
+                        team_id=USC_TEAM_ID, team_abbrev="USC", home_page="index.html",
+                        schedule_page_base="schedule", games_dir="games", game_label="game", rebuild=False):
+    """Write one team's home page, schedule pages and game pages, current and prior seasons.
 
-    print("Fetching NU player stats...")
-    nu_roster = get_roster_with_stats(team_id=NU_TEAM_ID)
+    The other_* arguments describe the other team, shown in the home page's cross-team section.
+    rebuild regenerates final game pages even when their game key is unchanged.
+    """
+    schedule_page = f"{schedule_page_base}.html"
+    # One "Data loaded" time for every page of the run
+    page_kwargs = {"team_id": team_id, "team_abbrev": team_abbrev, "home_page": home_page,
+                   "now": now_utc.astimezone(PT)}
 
-    # Fetch prior season rosters for NU (cached)
-    nu_prior_rosters = {}
+    # Classify the schedule once; the roster, odds and game pages all use it
+    completed, live, imminent_pre = split_event_states(schedule.get("events", []))
+
+    print(f"Fetching {team_abbrev} player stats...")
+    roster = get_roster_with_stats(team_id=team_id, completed=completed)
+
+    # Fetch prior season rosters (cached for completed seasons)
+    prior_rosters = {}
     for year in [2025, 2024]:
-        print(f"Fetching NU {year-1}-{str(year)[2:]} roster stats (cached)...")
-        nu_prior_rosters[year] = get_roster_with_stats_cached(NU_TEAM_ID, year)
-
-    nu_html = generate_game_html(nu_game, nu_schedule, rankings, nu_roster,
-        team_id=NU_TEAM_ID, team_abbrev="NU", home_page="nu.html", schedule_page="nu-schedule.html",
-        games_dir="nu-games",
-        other_game_data=usc_game, other_schedule=schedule,
-        other_team_id=USC_TEAM_ID, other_team_abbrev="USC", other_games_dir="games",
-        prior_rosters=nu_prior_rosters)
-    nu_path = Path(__file__).parent.parent / "nu.html"
-    nu_path.write_text(nu_html)
-    print(f"Written to {nu_path}")
-
-    nu_schedule_html = generate_schedule_html(nu_schedule, rankings,
-        team_id=NU_TEAM_ID, team_abbrev="NU", home_page="nu.html", games_dir="nu-games",
-        season_year=2026, schedule_page_base="nu-schedule")
-    nu_schedule_path = Path(__file__).parent.parent / "nu-schedule.html"
-    nu_schedule_path.write_text(nu_schedule_html)
-    print(f"Written to {nu_schedule_path}")
-
-    nu_prior_schedules = {}
+        print(f"Fetching {team_abbrev} {year-1}-{str(year)[2:]} roster stats (cached)...")
+        prior_rosters[year] = get_roster_with_stats_cached(team_id, year)
+
+    # Generate HTML
+    html = generate_game_html(game, schedule, rankings, roster, schedule_page=schedule_page,
+        games_dir=games_dir, other_game_data=other_game, other_schedule=other_schedule,
+        other_team_id=other_team_id, other_team_abbrev=other_team_abbrev, other_games_dir=other_games_dir,
+        prior_rosters=prior_rosters, **page_kwargs)
+    output_path = site_dir / home_page
+    output_path.write_bytes(html)
+    print(f"Written to {output_path}")
+
+    # Generate schedule pages for current and prior seasons
+    schedule_html = generate_schedule_html(schedule, rankings, games_dir=games_dir,
+        season_year=2026, schedule_page_base=schedule_page_base, **page_kwargs)
+    schedule_path = site_dir / schedule_page
+    schedule_path.write_bytes(schedule_html)
+    print(f"Written to {schedule_path}")
+
+    # Store prior schedules for reuse when generating game pages
+    prior_schedules = {}
     for prior_year in [2025, 2024]:
-        print(f"Fetching NU {prior_year-1}-{str(prior_year)[2:]} schedule...")
-        nu_prior_schedule = get_team_schedule(team_id=NU_TEAM_ID, season=prior_year)
-        nu_prior_schedules[prior_year] = nu_prior_schedule
-        nu_prior_html = generate_schedule_html(nu_prior_schedule, rankings,
-            team_id=NU_TEAM_ID, team_abbrev="NU", home_page="nu.html", games_dir="nu-games",
-            season_year=prior_year, schedule_page_base="nu-schedule")
-        nu_prior_path = Path(__file__).parent.parent / f"nu-schedule-{prior_year}.html"
-        nu_prior_path.write_text(nu_prior_html)
-        print(f"Written to {nu_prior_path}")
-
-    nu_games_dir = Path(__file__).parent.parent / "nu-games"
-    nu_games_dir.mkdir(exist_ok=True)
-
-    nu_events = nu_schedule.get("events", [])
-    nu_completed = [e for e in nu_events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") == "post"]
-    nu_live = [e for e in nu_events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") not in ("pre", "post", "")]
-
-    nu_team_records = {}
-    for event in nu_completed:
-        for competitor in event.get("competitions", [{}])[0].get("competitors", []):
-            abbrev = competitor.get("team", {}).get("abbreviation", "")
-            records = competitor.get("records", [])
-            for rec in records:
-                if rec.get("type") == "total":
-                    nu_team_records[abbrev] = rec.get("summary", "")
-                    break
+        print(f"Fetching {team_abbrev} {prior_year-1}-{str(prior_year)[2:]} schedule...")
+        prior_schedule = get_team_schedule(team_id=team_id, season=prior_year)
+        prior_schedules[prior_year] = prior_schedule
+        prior_html = generate_schedule_html(prior_schedule, rankings, games_dir=games_dir,
+            season_year=prior_year, schedule_page_base=schedule_page_base, **page_kwargs)
+        prior_path = site_dir / f"{schedule_page_base}-{prior_year}.html"
+        prior_path.write_bytes(prior_html)
+        print(f"Written to {prior_path}")
 
-    # Fetch odds for imminent/live NU games
-    nu_odds_map = {}
-    nu_imminent_pre = [e for e in nu_events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") == "pre"]
-    for event in nu_imminent_pre + nu_live:
-        comp = event.get("competitions", [{}])[0]
-        date_str = comp.get("date", "")
-        if date_str:
-            try:
-                game_time = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                if (game_time - now_utc).total_seconds() / 60 <= PREGAME_WINDOW_MINUTES:
-                    eid = event.get("id", "")
-                    competitors = comp.get("competitors", [])
-                    home_c = next((c for c in competitors if c.get("homeAway") == "home"), {})
-                    away_c = next((c for c in competitors if c.get("homeAway") == "away"), {})
-                    home_name = home_c.get("team", {}).get("displayName", "")
-                    away_name = away_c.get("team", {}).get("displayName", "")
-                    if eid and home_name and away_name:
-                        odds = fetch_game_odds(eid, home_name, away_name)
-                        if odds:
-                            nu_odds_map[eid] = odds
-            except Exception:
-                pass
+    # Generate individual game pages for completed and live games
+    team_games_dir = site_dir / games_dir
+    team_games_dir.mkdir(exist_ok=True)
 
-    nu_games_to_generate = nu_completed + nu_live
-    print(f"Generating {len(nu_games_to_generate)} NU game pages...")
-    for event in nu_games_to_generate:
-        event_id = event.get("id", "")
-        if event_id:
-            try:
-                game_html = generate_game_page(event_id, rankings, nu_team_records,
-                    team_id=NU_TEAM_ID, team_abbrev="NU", home_page="nu.html", schedule_page="nu-schedule.html",
-                    odds=nu_odds_map.get(event_id))
-                game_path = nu_games_dir / f"{event_id}.html"
-                game_path.write_text(game_html)
-            except Exception as e:
-                print(f"  Error generating NU game {event_id}: {e}")
-    print(f"Written NU game pages to {nu_games_dir}")
-
-    # Generate game pages for prior NU seasons
+    # Get current team records from schedule
+    # Iterate all completed games so each team's record reflects their latest appearance
+    team_records = collect_team_records(completed)
+
+    # Fetch odds for imminent/live games
+    odds_map = fetch_odds_map(imminent_pre + live, now_utc)
+
+    games_to_generate = completed + live
+    print(f"Generating {len(games_to_generate)} {team_abbrev} game pages...")
+    write_game_pages(games_to_generate, team_games_dir, label=game_label, odds_map=odds_map, rebuild=rebuild,
+                     rankings=rankings, team_records=team_records, schedule_page=schedule_page, **page_kwargs)
+    print(f"Written {team_abbrev} game pages to {team_games_dir}")
+
+    # Generate game pages for prior seasons
     for prior_year in [2025, 2024]:
-        nu_prior_schedule = nu_prior_schedules[prior_year]
-        nu_prior_events = nu_prior_schedule.get("events", [])
-        nu_prior_completed = [e for e in nu_prior_events if e.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state") == "post"]
-
-        nu_prior_team_records = {}
-        for event in nu_prior_completed:
-            for competitor in event.get("competitions", [{}])[0].get("competitors", []):
-                abbrev = competitor.get("team", {}).get("abbreviation", "")
-                records = competitor.get("records", [])
-                for rec in records:
-                    if rec.get("type") == "total":
-                        nu_prior_team_records[abbrev] = rec.get("summary", "")
-                        break
-
-        nu_prior_schedule_page = f"nu-schedule-{prior_year}.html"
-        print(f"Generating {len(nu_prior_completed)} NU {prior_year-1}-{str(prior_year)[2:]} game pages...")
-        for event in nu_prior_completed:
-            event_id = event.get("id", "")
-            if event_id:
-                try:
-                    game_html = generate_game_page(event_id, {}, nu_prior_team_records,
-                        team_id=NU_TEAM_ID, team_abbrev="NU", home_page="nu.html",
-                        schedule_page=nu_prior_schedule_page)
-                    game_path = nu_games_dir / f"{event_id}.html"
-                    game_path.write_text(game_html)
-                except Exception as e:
-                    print(f"  Error generating NU game {event_id}: {e}")
+        prior_events = prior_schedules[prior_year].get("events", [])
+        prior_completed = split_event_states(prior_events)[0]
+        prior_team_records = collect_team_records(prior_completed)
+
+        print(f"Generating {len(prior_completed)} {team_abbrev} {prior_year-1}-{str(prior_year)[2:]} game pages...")
+        write_game_pages(prior_completed, team_games_dir, label=game_label, rebuild=rebuild,
+                         rankings={}, team_records=prior_team_records,
+                         schedule_page=f"{schedule_page_base}-{prior_year}.html", **page_kwargs)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Fetch WBB data from ESPN and generate the static site.")
+    parser.add_argument("--force", action="store_true",
+                        help="update even if no game is live or starting soon")
+    parser.add_argument("--only", choices=("USC", "NU", "both"), default="both",
+                        help="only regenerate this team's pages")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="regenerate final game pages even if nothing they show has changed")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    do_usc = args.only in ("USC", "both")
+    do_nu = args.only in ("NU", "both")
+    site_dir = Path(__file__).parent.parent  # Pages are written at the repo root
+
+    print("Fetching Women's Basketball data...")
+
+    # Get schedules and scoreboard (lightweight calls)
+    schedule = get_team_schedule()
+    nu_schedule = get_team_schedule(team_id=NU_TEAM_ID)
+    scoreboard = get_scoreboard()
+    scoreboard_index = index_scoreboard(scoreboard)
+
+    # Check if we should update (either team live/imminent triggers update)
+    usc_should, usc_reason = is_game_live_or_imminent(schedule, scoreboard, scoreboard_index=scoreboard_index)
+    nu_should, nu_reason = is_game_live_or_imminent(nu_schedule, scoreboard, team_id=NU_TEAM_ID,
+                                                    scoreboard_index=scoreboard_index)
+    usc_should = usc_should and do_usc
+    nu_should = nu_should and do_nu
+    should_update = usc_should or nu_should
+    reason = usc_reason if usc_should or not do_nu else nu_reason
+
+    if not should_update and not args.force:
+        print(f"Skipping update: {reason}")
+        print("Use --force to update anyway")
+        sys.exit(1)  # Non-zero exit tells workflow to skip commit
+
+    print(f"Updating: {reason}" if should_update else "Forced update")
+
+    # Fetch rankings
+    rankings = get_rankings()
+    now_utc = datetime.now(timezone.utc)
+
+    # Find live/recent games for both teams (needed for cross-team display on homepages)
+    usc_game = find_usc_game(scoreboard, schedule, scoreboard_index=scoreboard_index)
+    nu_game = find_usc_game(scoreboard, nu_schedule, team_id=NU_TEAM_ID, scoreboard_index=scoreboard_index)
+
+    write_site_assets(site_dir)
+
+    # --- USC pages ---
+    if do_usc:
+        print("Generating USC pages...")
+        generate_team_pages(site_dir, schedule, usc_game, rankings, now_utc,
+                            other_game=nu_game, other_schedule=nu_schedule,
+                            other_team_id=NU_TEAM_ID, other_team_abbrev="NU", other_games_dir="nu-games",
+                            rebuild=args.rebuild)
+
+    # --- NU pages ---
+    if do_nu:
+        print("Generating NU pages...")
+        generate_team_pages(site_dir, nu_schedule, nu_game, rankings, now_utc,
+                            other_game=usc_game, other_schedule=schedule,
+                            other_team_id=USC_TEAM_ID, other_team_abbrev="USC", other_games_dir="games",
+                            team_id=NU_TEAM_ID, team_abbrev="NU", home_page="nu.html",
+                            schedule_page_base="nu-schedule", games_dir="nu-games", game_label="NU game",
+                            rebuild=args.rebuild)
 
     # --- B1G standings page ---
     print("Generating B1G standings page...")
@@ -3175,9 +3112,9 @@ def main():
         print(f"  Error fetching leaders: {e}")
         leaders = {}
 
-    standings_html = generate_standings_html(standings, rankings, leaders)
-    standings_path = Path(__file__).parent.parent / "b1g.html"
-    standings_path.write_text(standings_html)
+    standings_html = generate_standings_html(standings, rankings, leaders, now=now_utc.astimezone(PT))
+    standings_path = site_dir / "b1g.html"
+    standings_path.write_bytes(standings_html)
     print(f"Written to {standings_path}")
 
 
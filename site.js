@@ -0,0 +1,73 @@
+(function() {
+    const dataLoaded = new Date(document.querySelector('meta[name="data-loaded"]').content);
+    const pageLoaded = new Date();
+
+    function formatTime(date) {
+        return date.toLocaleTimeString('en-US', { hour: 'numeric', minute: '2-digit', second: '2-digit', hour12: true });
+    }
+
+    function timeAgo(date) {
+        const seconds = Math.floor((new Date() - date) / 1000);
+        if (seconds < 60) return 'just now';
+        const minutes = Math.floor(seconds / 60);
+        if (minutes < 60) return minutes + ' min ago';
+        const hours = Math.floor(minutes / 60);
+        if (hours < 24) return hours + ' hr ago';
+        const days = Math.floor(hours / 24);
+        return days + ' day' + (days > 1 ? 's' : '') + ' ago';
+    }
+
+    function updateTimestamps() {
+        const el = document.getElementById('timestamps');
+        if (el) {
+            const pageLoadedStr = 'Page loaded: ' + formatTime(pageLoaded);
+            const pageAgo = '(' + timeAgo(pageLoaded) + ')';
+            const pagePadding = 65 - pageLoadedStr.length - pageAgo.length;
+            const pageSpaces = pagePadding > 0 ? ' '.repeat(pagePadding) : ' ';
+
+            const dataLoadedStr = 'Data loaded: ' + formatTime(dataLoaded);
+            const dataAgo = '(' + timeAgo(dataLoaded) + ')';
+            const dataPadding = 65 - dataLoadedStr.length - dataAgo.length;
+            const dataSpaces = dataPadding > 0 ? ' '.repeat(dataPadding) : ' ';
+
+            el.innerHTML = pageLoadedStr + pageSpaces + pageAgo + '\n' + dataLoadedStr + dataSpaces + dataAgo;
+        }
+    }
+
+    updateTimestamps();
+    setInterval(updateTimestamps, 60000); // Update every minute
+})();
+function showStats(view) {
+    ['totals','pergame','per40','per100'].forEach(function(v) {
+        document.getElementById('stats-' + v).style.display = v === view ? '' : 'none';
+    });
+}
+function showStats_2025(view) {
+    ['totals','pergame','per40','per100'].forEach(function(v) {
+        document.getElementById('stats-' + v + '-2025').style.display = v === view ? '' : 'none';
+    });
+}
+function showStats_2024(view) {
+    ['totals','pergame','per40','per100'].forEach(function(v) {
+        document.getElementById('stats-' + v + '-2024').style.display = v === view ? '' : 'none';
+    });
+}
+function showSeason(year) {
+    ['2026','2025','2024'].forEach(function(y) {
+        var el = document.getElementById('season-' + y);
+        if (el) el.style.display = y === year ? '' : 'none';
+    });
+    var nav = document.getElementById('year-nav');
+    if (nav) {
+        var labels = {'2026': '2025-26', '2025': '2024-25', '2024': '2023-24'};
+        var parts = [];
+        ['2026','2025','2024'].forEach(function(y) {
+            if (y === year) {
+                parts.push('<b>' + labels[y] + '</b>');
+            } else {
+                parts.push('<a href="javascript:void(0)" onclick="showSeason(\'' + y + '\')">' + labels[y] + '</a>');
+            }
+        });
+        nav.innerHTML = parts.join(' | ');
+    }
+}